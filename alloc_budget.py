@@ -0,0 +1,115 @@
+import gc
+import os
+import sys
+import tracemalloc
+
+ALLOC_BUDGET_BYTES = 16 * 1024  # Vârful de memorie alocată într-un cadru, după încălzire
+WARMUP_FRAMES = 120  # Primele cadre umplu cache-urile (text, sprite-uri) și nu se numără
+CHECK_FRAMES = 3000
+
+def alloc_budget_requested(argv=None):
+    """Modul de depanare a alocărilor se activează cu --alloc-budget în linia de comandă"""
+    return "--alloc-budget" in (sys.argv if argv is None else argv)
+
+class FrameAllocationMonitor:
+    """Măsoară cu tracemalloc memoria alocată în fiecare cadru.
+
+    Bucla apelează `begin_frame()` la începutul cadrului și `end_frame()` la
+    sfârșit; se reține vârful alocărilor din cadru, chiar dacă memoria a fost
+    eliberată până la final (tocmai alocările temporare declanșează GC-ul).
+    Cadrele de încălzire și cele marcate cu `skip_frame()` (de ex. un restart)
+    nu intră în statistici.
+    """
+    def __init__(self, budget=ALLOC_BUDGET_BYTES, warmup_frames=WARMUP_FRAMES):
+        self.budget = budget
+        self.warmup_frames = warmup_frames
+        self.frames = 0
+        self.measured_frames = 0
+        self.frames_over = 0
+        self.worst = 0
+        self.total = 0
+        self.skipping = False
+        self.frame_start = 0
+        self.collections_start = None
+        self.collections = 0
+
+    def begin_frame(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self.frame_start = tracemalloc.get_traced_memory()[0]
+        self.skipping = False
+
+    def skip_frame(self):
+        """Cadrul curent nu se numără (schimbare de stare care alocă intenționat)"""
+        self.skipping = True
+
+    def end_frame(self):
+        peak = tracemalloc.get_traced_memory()[1]
+        self.frames += 1
+        if self.frames <= self.warmup_frames or self.skipping:
+            return
+        if self.collections_start is None:
+            self.collections_start = gc.get_stats()[0]["collections"]
+        self.collections = gc.get_stats()[0]["collections"] - self.collections_start
+
+        allocated = peak - self.frame_start
+        self.measured_frames += 1
+        self.total += allocated
+        self.worst = max(self.worst, allocated)
+        if allocated > self.budget:
+            self.frames_over += 1
+
+    def within_budget(self):
+        return self.frames_over == 0
+
+    def average(self):
+        return self.total / self.measured_frames if self.measured_frames else 0.0
+
+    def report(self):
+        return (f"Alocări pe cadru ({self.measured_frames} cadre măsurate): "
+                f"medie {self.average():.0f} B, maxim {self.worst} B, buget {self.budget} B, "
+                f"{self.frames_over} cadre peste buget, {self.collections} colectări GC gen0")
+
+def measure_game_loop(frames=CHECK_FRAMES, budget=ALLOC_BUDGET_BYTES, seed=0, skins=False):
+    """Rulează bucla de joc din claude.py fără fereastră și returnează monitorul.
+
+    Fiecare cadru face simulare + desenare + present, ca Game.run; la game over
+    jocul repornește, iar cadrul cu restartul nu se numără.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    # Import târziu: claude.py importă acest modul pentru modul --alloc-budget
+    from claude import Game, GAME
+    from headless import RandomWalkInput, VirtualClock
+
+    game = Game()
+    game.state = GAME
+    game.skins_enabled = skins
+    game.reset_game(seed)
+    input_source = RandomWalkInput(seed)
+    clock = VirtualClock()
+    monitor = FrameAllocationMonitor(budget)
+
+    for frame in range(frames):
+        monitor.begin_frame()
+        game.step(input_source(frame, game), clock.tick())
+        game.draw_game()
+        game.renderer.present()
+        if game.game_over:
+            game.reset_game()
+            monitor.skip_frame()
+        monitor.end_frame()
+
+    tracemalloc.stop()
+    return monitor
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else CHECK_FRAMES
+    budget = int(sys.argv[2]) if len(sys.argv) > 2 else ALLOC_BUDGET_BYTES
+    monitor = measure_game_loop(frames, budget)
+    print(monitor.report())
+    # Cod de ieșire nenul: scripturile de verificare pică dacă bucla depășește bugetul
+    sys.exit(0 if monitor.within_budget() else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+import os
+import re
+
+import pygame
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+ATLAS_MAX_WIDTH = 1024
+ANIMATION_FPS = 20  # Ritmul în care au fost desenate benzile din assets/
+
+# "Flying (46x30).png" -> acțiunea "Flying", cadre de 46x30
+FRAME_SIZE_PATTERN = re.compile(r"^(?P<action>.+?)\s*\((?P<width>\d+)x(?P<height>\d+)\)$")
+
+def parse_strip_name(filename):
+    """Returnează (acțiune, lățime cadru, înălțime cadru); dimensiunea e None dacă lipsește din nume"""
+    name = os.path.splitext(os.path.basename(filename))[0]
+    match = FRAME_SIZE_PATTERN.match(name)
+    if match is None:
+        return name, None
+    return match.group("action"), (int(match.group("width")), int(match.group("height")))
+
+def slice_strip(image, frame_size):
+    """Taie o bandă de animație în cadre (de la stânga la dreapta, rând cu rând)"""
+    if frame_size is None:
+        return [image]
+    width, height = frame_size
+    frames = []
+    for top in range(0, image.get_height() - height + 1, height):
+        for left in range(0, image.get_width() - width + 1, width):
+            frames.append(image.subsurface((left, top, width, height)))
+    return frames
+
+class SpriteAtlas:
+    """O singură textură cu toate cadrele, plus dreptunghiurile lor pre-calculate.
+
+    Clipurile sunt indexate după (personaj, acțiune), de ex. ("Bat", "Flying");
+    fiecare are și varianta oglindită pe orizontală, tot în atlas.
+    """
+    def __init__(self, surface, clips, flipped_clips):
+        self.surface = surface
+        self.clips = clips
+        self.flipped_clips = flipped_clips
+
+    def frames(self, character, action, flipped=False):
+        clips = self.flipped_clips if flipped else self.clips
+        return clips[(character, action)]
+
+    def frame_size(self, character, action):
+        rect = self.clips[(character, action)][0]
+        return rect.width, rect.height
+
+    def blit(self, screen, frame_rect, position):
+        return screen.blit(self.surface, position, frame_rect)
+
+def load_atlas(directory=ASSETS_DIR, scales=None, max_width=ATLAS_MAX_WIDTH):
+    """Încarcă toate benzile din `directory`/<personaj>/*.png într-un atlas.
+
+    `scales` poate da un factor de scalare per personaj, aplicat o singură dată
+    la încărcare (de ex. {"Chicken": 0.5}).
+    """
+    scales = scales or {}
+    strips = []
+    for character in sorted(os.listdir(directory)):
+        folder = os.path.join(directory, character)
+        if not os.path.isdir(folder):
+            continue
+        for filename in sorted(os.listdir(folder)):
+            if not filename.lower().endswith(".png"):
+                continue
+            action, frame_size = parse_strip_name(filename)
+            image = pygame.image.load(os.path.join(folder, filename))
+            frames = slice_strip(image, frame_size)
+            scale = scales.get(character, 1)
+            if scale != 1:
+                frames = [pygame.transform.scale(frame, (round(frame.get_width() * scale),
+                                                         round(frame.get_height() * scale)))
+                          for frame in frames]
+            strips.append(((character, action), frames))
+            strips.append(((character, action, "flipped"),
+                           [pygame.transform.flip(frame, True, False) for frame in frames]))
+
+    # Împachetare pe rafturi: clipurile cele mai înalte primele
+    strips.sort(key=lambda strip: -strip[1][0].get_height())
+    placements = []
+    x = y = shelf_height = atlas_width = 0
+    for key, frames in strips:
+        rects = []
+        for frame in frames:
+            width, height = frame.get_size()
+            if x + width > max_width:
+                x = 0
+                y += shelf_height
+                shelf_height = 0
+            rects.append(pygame.Rect(x, y, width, height))
+            x += width
+            shelf_height = max(shelf_height, height)
+            atlas_width = max(atlas_width, x)
+        placements.append((key, frames, rects))
+
+    surface = pygame.Surface((max(1, atlas_width), max(1, y + shelf_height)), pygame.SRCALPHA)
+    clips = {}
+    flipped_clips = {}
+    for key, frames, rects in placements:
+        for frame, rect in zip(frames, rects):
+            surface.blit(frame, rect)
+        if len(key) == 3:
+            flipped_clips[key[:2]] = rects
+        else:
+            clips[key] = rects
+
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha()
+    return SpriteAtlas(surface, clips, flipped_clips)
+
+class Animation:
+    """Redă un clip din atlas; timpul avansează cu `update(dt)` în milisecunde"""
+    def __init__(self, atlas, character, action, fps=ANIMATION_FPS, loop=True):
+        self.atlas = atlas
+        self.character = character
+        self.fps = fps
+        self.loop = loop
+        self.play(action)
+
+    def play(self, action):
+        """Schimbă acțiunea (de ex. "Idle" -> "Run"); repornește doar dacă e alta"""
+        if getattr(self, "action", None) == action:
+            return
+        self.action = action
+        self.time = 0
+        self.frame_count = len(self.atlas.frames(self.character, action))
+
+    def update(self, dt):
+        self.time += dt
+
+    def frame_index(self):
+        index = int(self.time * self.fps // 1000)
+        if self.loop:
+            return index % self.frame_count
+        return min(index, self.frame_count - 1)
+
+    def is_finished(self):
+        return not self.loop and int(self.time * self.fps // 1000) >= self.frame_count
+
+    def draw(self, screen, center, flipped=False):
+        """Desenează cadrul curent centrat în `center`"""
+        rect = self.atlas.frames(self.character, self.action, flipped)[self.frame_index()]
+        return self.atlas.blit(screen, rect, (center[0] - rect.width // 2, center[1] - rect.height // 2))
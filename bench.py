@@ -0,0 +1,179 @@
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+# Fără fereastră: driverul dummy trebuie setat înainte de importul pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from claude import Game, GAME
+from dodge.claude import ProbabilisticGenerator, Simulation, MAX_SIMULTANEOUS_BLOCKS
+from dodge import gemini
+from dodge.gemini import generate_line_pattern, generate_zigzag_pattern, generate_grid_pattern
+from headless import RandomWalkInput, VirtualClock
+from scores import ScoreStore, session_record
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_baseline.json")
+REGRESSION_THRESHOLD = 0.20  # Mediana cu peste 20% mai mare decât baseline-ul e marcată
+SEED = 0
+MICRO_CALLS = 5000
+MACRO_FRAMES = 3000
+SCORE_ROWS = 200_000  # Sesiuni în baza folosită de bench_score_queries
+
+def summarize(samples):
+    """Mediana și p99 în microsecunde, din durate în nanosecunde"""
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return {"median_us": statistics.median(ordered) / 1000, "p99_us": p99 / 1000, "samples": len(ordered)}
+
+def time_calls(function, arguments):
+    """Durata fiecărui apel function(*args), pentru fiecare set de argumente"""
+    clock = time.perf_counter_ns
+    samples = []
+    for args in arguments:
+        start = clock()
+        function(*args)
+        samples.append(clock() - start)
+    return samples
+
+def bench_gemini_patterns(calls=MICRO_CALLS, seed=SEED):
+    rng = random.Random(seed)
+    width, block_size = gemini.SCREEN_WIDTH, gemini.BLOCK_SIZE
+    return {
+        "gemini.generate_line_pattern": summarize(time_calls(
+            generate_line_pattern, [(width, block_size, None, rng) for _ in range(calls)])),
+        "gemini.generate_zigzag_pattern": summarize(time_calls(
+            generate_zigzag_pattern, [(width, block_size, step) for step in range(calls)])),
+        "gemini.generate_grid_pattern": summarize(time_calls(
+            generate_grid_pattern, [(width, block_size, 0.3, rng) for _ in range(calls)])),
+    }
+
+def bench_spawn_positions(calls=MICRO_CALLS, seed=SEED):
+    """get_spawn_positions pe stări reale de joc, luate dintr-o sesiune scriptată"""
+    sim = Simulation()
+    sim.reset_game(seed)
+    input_source = RandomWalkInput(seed)
+    clock = VirtualClock()
+    generator = ProbabilisticGenerator(random.Random(seed))
+    samples = []
+    frame = 0
+    while len(samples) < calls:
+        sim.step(input_source(frame, sim), clock.tick())
+        frame += 1
+        if sim.game_over:
+            sim.reset_game(seed + frame)
+            continue
+        count = min(len(sim.blocks) + len(sim.powerups), MAX_SIMULTANEOUS_BLOCKS - 1)
+        samples.extend(time_calls(generator.get_spawn_positions, [(sim.player, sim.grid_manager, count)]))
+    return {"claude.ProbabilisticGenerator.get_spawn_positions": summarize(samples)}
+
+def bench_game_frames(frames=MACRO_FRAMES, seed=SEED):
+    """Costul pe cadru al Game.update_game, Game.draw_game și al afișării, cu intrare scriptată"""
+    game = Game()
+    game.clock = VirtualClock()
+    game.state = GAME
+    game.reset_game(seed)
+    input_source = RandomWalkInput(seed)
+    clock = time.perf_counter_ns
+    update, draw, present, total = [], [], [], []
+
+    for frame in range(frames):
+        game.clock.tick()
+        start = clock()
+        game.update_game(input_source(frame, game))
+        updated = clock()
+        game.draw_game()
+        drawn = clock()
+        game.renderer.present()
+        end = clock()
+        update.append(updated - start)
+        draw.append(drawn - updated)
+        present.append(end - drawn)
+        total.append(end - start)
+        if game.state != GAME:
+            game.state = GAME
+            game.reset_game(seed + frame)
+
+    return {
+        "claude.Game.update_game": summarize(update),
+        "claude.Game.draw_game": summarize(draw),
+        "claude.present": summarize(present),
+        "claude.frame": summarize(total),
+    }
+
+def bench_score_queries(calls=MICRO_CALLS // 5, rows=SCORE_ROWS, seed=SEED):
+    """Clasamentele din ScoreStore pe o bază temporară cu `rows` sesiuni din ultimul an"""
+    rng = random.Random(seed)
+    variants = ("claude", "gemini", "chatgpt", "perplexity", "copilot")
+    now = time.time()
+    with tempfile.TemporaryDirectory() as directory:
+        store = ScoreStore(os.path.join(directory, "scores.db"))
+        batch = 10_000
+        for _ in range(rows // batch):
+            store.write_batch([session_record(rng.choice(variants), rng.randrange(10_000), rng.randrange(600_000),
+                                              now=now - rng.random() * 365 * 86400)
+                               for _ in range(batch)])
+        days = [time.strftime("%Y-%m-%d", time.localtime(now - rng.randrange(365) * 86400)) for _ in range(calls)]
+        results = {
+            "scores.ScoreStore.top": summarize(time_calls(
+                store.top, [(rng.choice(variants),) for _ in range(calls)])),
+            "scores.ScoreStore.top_on_day": summarize(time_calls(
+                store.top_on_day, [(rng.choice(variants), day) for day in days])),
+        }
+        store.close()
+    return results
+
+def run_all():
+    results = {}
+    results.update(bench_gemini_patterns())
+    results.update(bench_spawn_positions())
+    results.update(bench_game_frames())
+    results.update(bench_score_queries())
+    return results
+
+def load_baseline(path=BASELINE_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+def save_baseline(results, path=BASELINE_PATH):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+def compare(results, baseline, threshold=REGRESSION_THRESHOLD):
+    """Tabelul cu rezultatele și diferența față de baseline; returnează (linii, regresii)"""
+    lines = [f"{'benchmark':<52} {'mediană µs':>11} {'p99 µs':>10} {'Δ mediană':>10}"]
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        delta = ""
+        if previous:
+            change = result["median_us"] / previous["median_us"] - 1
+            delta = f"{change:+.1%}"
+            if change > threshold:
+                delta += " LENT"
+                regressions.append(name)
+        lines.append(f"{name:<52} {result['median_us']:>11.2f} {result['p99_us']:>10.2f} {delta:>10}")
+    return lines, regressions
+
+def main():
+    # --save-baseline rescrie bench_baseline.json; --check iese cu cod 1 la regresii
+    results = run_all()
+    lines, regressions = compare(results, load_baseline())
+    print("\n".join(lines))
+    if "--save-baseline" in sys.argv:
+        save_baseline(results)
+        print(f"Baseline salvat în {BASELINE_PATH}")
+    elif regressions:
+        print(f"{len(regressions)} benchmark-uri peste pragul de {REGRESSION_THRESHOLD:.0%}: {', '.join(regressions)}")
+        if "--check" in sys.argv:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
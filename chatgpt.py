@@ -1,14 +1,22 @@
 import pygame
-import random
 import sys
 
+from dodge.chatgpt import (WIDTH, HEIGHT, player_size, player_speed, block_size, block_speed, spawn_delay,
+                           patterns, PATTERN_DURATION, spawn_positions, pattern_streams)
+from spatial import ColumnBuckets
+from dirty_rects import DirtyRectRenderer, dirty_rects_requested
+from replay import restart_session, seeded_session
+from scores import open_scores, session_record
+from startup import frame_presented, init_pygame, sys_font
+from text_cache import render_text
+
 # Inițializare Pygame
-pygame.init()
+init_pygame()
 
-# Configurări fereastră
-WIDTH, HEIGHT = 320, 240
+# Fereastra
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Pixel Dodge")
+renderer = DirtyRectRenderer(screen, (50, 90, 200), enabled=dirty_rects_requested())
 
 # Culori (paletă de 4 culori)
 BLACK = (0, 0, 0)
@@ -18,21 +26,22 @@ BLUE = (50, 90, 200)
 
 # Clock & font
 clock = pygame.time.Clock()
-font = pygame.font.SysFont("Arial", 16)
+font = sys_font("Arial", 16)  # Fișierul fontului rezolvat o dată, apoi din cache
 
 # Player
-player_size = 16
-player_speed = 3
 player = pygame.Rect(WIDTH // 2, HEIGHT - 40, player_size, player_size)
 
 # Blocuri
-block_size = 32
-block_speed = 2
 blocks = []
+block_index = ColumnBuckets(WIDTH, block_size)  # Blocurile grupate pe coloane pentru coliziuni
+
+# Aleatorism cu seed cunoscut, salvat cu scorul sesiunii
+rng, seed = seeded_session("chatgpt")
+rows = pattern_streams(rng)  # Rândurile 'line' și 'grid'; rows[...].peek(n) le arată pe următoarele n
+scores = open_scores()  # Baza de scoruri (--scores FIȘIER, --no-scores)
 
-# Patternuri de generare
-patterns = ['line', 'zigzag', 'grid']
-current_pattern = random.choice(patterns)
+# Patternul curent
+current_pattern = rng.choice(patterns)
 pattern_timer = 0
 
 # Timp și scor
@@ -41,66 +50,55 @@ score = 0
 game_over = False
 
 def draw_player():
-    pygame.draw.rect(screen, WHITE, player)
+    rect = pygame.draw.rect(screen, WHITE, player)
     pygame.draw.rect(screen, BLACK, player, 1)  # contur
+    return rect
 
 def draw_block(block):
-    pygame.draw.rect(screen, RED, block)
+    rect = pygame.draw.rect(screen, RED, block)
     pygame.draw.rect(screen, BLACK, block, 1)  # contur
+    return rect
 
-def spawn_blocks(pattern):
-    blocks = []
-    if pattern == 'line':
-        # Adaugă o „poartă” (gol) aleatorie de 1 sau 2 blocuri
-        total_blocks = WIDTH // block_size
-        gate_start = random.randint(1, total_blocks - 2)  # evită marginile
-        gate_width = random.choice([1, 2])  # lățimea porții în blocuri
-
-        for i in range(total_blocks):
-            if gate_start <= i < gate_start + gate_width:
-                continue  # sărim peste blocurile din poartă
-            blocks.append(pygame.Rect(i * block_size, -block_size, block_size, block_size))
-
-    elif pattern == 'zigzag':
-        for i in range(0, WIDTH, block_size * 2):
-            offset = (block_size if (pygame.time.get_ticks() // 500) % 2 == 0 else 0)
-            blocks.append(pygame.Rect(i + offset, -block_size, block_size, block_size))
-
-    elif pattern == 'grid':
-        for i in range(0, WIDTH, block_size * 2):
-            if random.random() > 0.5:
-                blocks.append(pygame.Rect(i, -block_size, block_size, block_size))
-
-    return blocks
+def spawn_blocks(pattern, rng):
+    if pattern in rows:
+        xs = next(rows[pattern])
+    else:
+        xs = spawn_positions(pattern, rng, pygame.time.get_ticks())
+    return [pygame.Rect(x, -block_size, block_size, block_size) for x in xs]
 
 
 def reset_game():
-    global blocks, player, score, start_ticks, current_pattern
+    global blocks, player, score, start_ticks, current_pattern, seed, rows
     player.x = WIDTH // 2
     player.y = HEIGHT - 40
     blocks = []
+    block_index.clear()
     score = 0
     start_ticks = pygame.time.get_ticks()
-    current_pattern = random.choice(patterns)
+    seed = restart_session(rng)  # Fiecare sesiune are seed-ul ei
+    rows = pattern_streams(rng)
+    current_pattern = rng.choice(patterns)
+    renderer.invalidate()
 
 # Loop principal
-spawn_delay = 1000
 last_spawn = pygame.time.get_ticks()
 
 while True:
     dt = clock.tick(60)
-    screen.fill(BLUE)
+    renderer.begin_frame()
 
     # Timp și scor
     seconds = (pygame.time.get_ticks() - start_ticks) / 1000
     score = int(seconds)
 
-    if pygame.time.get_ticks() - pattern_timer > 10000:
-        current_pattern = random.choice(patterns)
+    if pygame.time.get_ticks() - pattern_timer > PATTERN_DURATION:
+        current_pattern = rng.choice(patterns)
         pattern_timer = pygame.time.get_ticks()
 
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
+            if scores is not None:
+                scores.close()
             pygame.quit()
             sys.exit()
 
@@ -116,37 +114,45 @@ while True:
 
     # Generare blocuri
     if pygame.time.get_ticks() - last_spawn > spawn_delay:
-        blocks.extend(spawn_blocks(current_pattern))
+        for block in spawn_blocks(current_pattern, rng):
+            blocks.append(block)
+            block_index.insert(block, block.x, block.width)
         last_spawn = pygame.time.get_ticks()
 
     # Update blocuri
     for block in blocks:
         block.y += block_speed
-        draw_block(block)
+        renderer.mark(draw_block(block))
 
     # Eliminare blocuri ieșite din ecran
+    for block in blocks:
+        if block.y >= HEIGHT:
+            block_index.remove(block)
     blocks = [b for b in blocks if b.y < HEIGHT]
 
-    # Coliziuni
-    for block in blocks:
+    # Coliziuni (doar blocurile din coloanele atinse de player)
+    for block in block_index.query(player.x, player.width):
         if player.colliderect(block):
             game_over = True
             break
 
     # Desenează playerul
-    draw_player()
+    renderer.mark(draw_player())
 
     # Text scor
-    score_text = font.render(f"Score: {score}", True, WHITE)
-    screen.blit(score_text, (10, 10))
+    score_text = render_text(font, f"Score: {score}", True, WHITE)
+    renderer.mark(screen.blit(score_text, (10, 10)))
 
     # Game over
     if game_over:
-        game_over_text = font.render(f"Game Over! Score: {score}", True, BLACK)
+        if scores is not None:
+            scores.record(session_record("chatgpt", score, seconds * 1000, seed=seed))
+        game_over_text = render_text(font, f"Game Over! Score: {score}", True, BLACK)
         screen.blit(game_over_text, (WIDTH // 2 - 60, HEIGHT // 2))
         pygame.display.flip()
         pygame.time.wait(3000)
         reset_game()
         game_over = False
 
-    pygame.display.flip()
+    renderer.present()
+    frame_presented()
@@ -1,55 +1,51 @@
-import pygame, random, sys
+import pygame, sys
+
+from dodge.copilot import (WIDTH, HEIGHT, player_size, player_speed, block_size, block_speed, spawn_patterns,
+                           SPAWN_INTERVAL, PATTERN_DURATION, pattern_streams)
+from spatial import ColumnBuckets
+from dirty_rects import DirtyRectRenderer, dirty_rects_requested
+from replay import seeded_session
+from scores import open_scores, session_record
+from startup import frame_presented, init_pygame, sys_font
+from text_cache import render_text
 
 # Configurări
-pygame.init()
-WIDTH, HEIGHT = 480, 640
+init_pygame()
 SCREEN = pygame.display.set_mode((WIDTH, HEIGHT))
 CLOCK = pygame.time.Clock()
-FONT = pygame.font.SysFont("Arial", 24)
+FONT = sys_font("Arial", 24)
 
 # Culori
 WHITE, BLACK, RED, BLUE = (255, 255, 255), (0, 0, 0), (200, 50, 50), (50, 100, 200)
+renderer = DirtyRectRenderer(SCREEN, BLACK, enabled=dirty_rects_requested())
+
+# Aleatorism cu seed cunoscut, salvat cu scorul sesiunii
+rng, seed = seeded_session("copilot")
+rows = pattern_streams(rng)  # Un flux de rânduri pe pattern; rows[...].peek(n) le arată pe următoarele n
+scores = open_scores()  # Baza de scoruri (--scores FIȘIER, --no-scores)
 
 # Personaj
-player_size = 16
 player = pygame.Rect(WIDTH//2, HEIGHT - 50, player_size, player_size)
-player_speed = 4
 
 # Blocuri
-block_size = 32
 blocks = []
-spawn_patterns = ['line', 'zigzag', 'grid']
+block_index = ColumnBuckets(WIDTH, block_size)  # Blocurile grupate pe coloane pentru coliziuni
 pattern_timer = pygame.time.get_ticks()
 block_timer = pygame.time.get_ticks()
-current_pattern = random.choice(spawn_patterns)
+current_pattern = rng.choice(spawn_patterns)
 score = 0
 
-def generate_block_positions(pattern):
-    positions = []
-    if pattern == 'line':
-        for i in range(0, WIDTH, block_size):
-            if random.random() > 0.2:  # ~80% șansă să apară un bloc
-                positions.append(i)
-    elif pattern == 'zigzag':
-        for i in range(0, WIDTH, block_size*2):
-            offset = block_size if (i//block_size) % 2 == 0 else 0
-            positions.append(i + offset)
-    elif pattern == 'grid':
-        for i in range(0, WIDTH, block_size*2):
-            if random.random() > 0.5:
-                positions.append(i)
-    return positions
-
-
 # Joc
 start_time = pygame.time.get_ticks()
 running = True
 while running:
-    SCREEN.fill(BLACK)
+    renderer.begin_frame()
     keys = pygame.key.get_pressed()
 
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
+            if scores is not None:
+                scores.close()
             pygame.quit()
             sys.exit()
 
@@ -62,41 +58,55 @@ while running:
     current_time = pygame.time.get_ticks()
 
     # Schimbă pattern la 10 secunde
-    if current_time - pattern_timer >= 10000:
-        current_pattern = random.choice(spawn_patterns)
+    if current_time - pattern_timer >= PATTERN_DURATION:
+        current_pattern = rng.choice(spawn_patterns)
         pattern_timer = current_time
 
     # Generează blocuri la fiecare 1 secundă
-    if current_time - block_timer >= 1000:
-        positions = generate_block_positions(current_pattern)
+    if current_time - block_timer >= SPAWN_INTERVAL:
+        positions = next(rows[current_pattern])
         for x in positions:
-            blocks.append(pygame.Rect(x, -block_size, block_size, block_size))
+            block = pygame.Rect(x, -block_size, block_size, block_size)
+            blocks.append(block)
+            block_index.insert(block, block.x, block.width)
         block_timer = current_time
 
     # Mișcare blocuri
-    for block in blocks[:]:
-        block.y += 4
+    for block in blocks:
+        block.y += block_speed
+
+    # Coliziuni doar cu blocurile din coloanele atinse de player
+    for block in block_index.query(player.x, player.width):
         if block.colliderect(player):
+            if scores is not None:
+                scores.record(session_record("copilot", score, current_time - start_time, blocks_avoided=score,
+                                             seed=seed))
+                scores.close()
             SCREEN.fill(BLACK)
-            text = FONT.render(f"Game Over! Scor: {score}", True, WHITE)
+            text = render_text(FONT, f"Game Over! Scor: {score}", True, WHITE)
             SCREEN.blit(text, (WIDTH//2 - text.get_width()//2, HEIGHT//2))
             pygame.display.update()
             pygame.time.delay(3000)
             pygame.quit()
             sys.exit()
+
+    # Eliminare blocuri ieșite din ecran
+    for block in blocks:
         if block.y > HEIGHT:
-            blocks.remove(block)
+            block_index.remove(block)
             score += 1
+    blocks = [b for b in blocks if b.y <= HEIGHT]
 
     # Desenare
-    pygame.draw.rect(SCREEN, RED, player)
+    renderer.mark(pygame.draw.rect(SCREEN, RED, player))
     for block in blocks:
-        pygame.draw.rect(SCREEN, WHITE, block, 1)
+        renderer.mark(pygame.draw.rect(SCREEN, WHITE, block, 1))
         pygame.draw.rect(SCREEN, WHITE, block.inflate(-2, -2))
 
     # Afișare scor
-    score_text = FONT.render(f"Scor: {score}", True, BLUE)
-    SCREEN.blit(score_text, (10, 10))
+    score_text = render_text(FONT, f"Scor: {score}", True, BLUE)
+    renderer.mark(SCREEN.blit(score_text, (10, 10)))
 
-    pygame.display.update()
+    renderer.present()
+    frame_presented()
     CLOCK.tick(60)
@@ -0,0 +1,72 @@
+import sys
+
+import pygame
+
+MAX_DIRTY_RECTS = 200  # Peste atâtea zone, un flip complet e mai ieftin
+
+def dirty_rects_requested(argv=None):
+    """Modul dirty-rect se activează cu --dirty-rects în linia de comandă"""
+    return "--dirty-rects" in (sys.argv if argv is None else argv)
+
+class DirtyRectRenderer:
+    """Redesenare parțială a ecranului: șterge și actualizează doar zonele schimbate.
+
+    Bucla de joc apelează `begin_frame()` în loc de screen.fill, trece prin
+    `mark()` dreptunghiurile întoarse de blit/draw și termină cu `present()`
+    în loc de display.flip. Zonele desenate în cadrul anterior se șterg cu
+    fundalul, iar display.update primește doar zonele vechi și noi.
+    Efectele care acoperă tot ecranul apelează `mark_full()`. Cu
+    `enabled=False` se comportă exact ca fill + flip.
+    """
+    def __init__(self, screen, background, enabled=True):
+        self.screen = screen
+        self.background = background
+        self.enabled = enabled
+        self.previous = []  # Zonele desenate în cadrul anterior
+        self.current = []
+        self.updates = []  # Zone de actualizat care nu trebuie șterse de noi
+        self.full_clear_pending = True
+        self.flip_pending = False
+
+    def invalidate(self):
+        """Următorul cadru șterge și actualizează tot ecranul (schimbare de stare)"""
+        self.full_clear_pending = True
+
+    def begin_frame(self):
+        if not self.enabled or self.full_clear_pending:
+            self.screen.fill(self.background)
+            self.flip_pending = True
+            self.full_clear_pending = False
+        else:
+            for rect in self.previous:
+                self.screen.fill(self.background, rect)
+
+    def mark(self, rects):
+        """Înregistrează o zonă desenată (Rect, listă de Rect sau None)"""
+        if not self.enabled or rects is None:
+            return
+        if isinstance(rects, pygame.Rect):
+            self.current.append(rects)
+        else:
+            self.current.extend(rects)
+
+    def mark_update(self, rects):
+        """Zone de trimis pe ecran pe care le șterge altcineva (de ex. LayeredDirty)"""
+        if self.enabled:
+            self.updates.extend(rects)
+
+    def mark_full(self):
+        """S-a desenat peste tot ecranul; cadrul următor îl va șterge complet"""
+        self.flip_pending = True
+        self.full_clear_pending = True
+
+    def present(self):
+        rects = self.previous + self.current + self.updates
+        if not self.enabled or self.flip_pending or len(rects) > MAX_DIRTY_RECTS:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+        self.previous = self.current
+        self.current = []
+        self.updates = []
+        self.flip_pending = False
@@ -0,0 +1,8 @@
+"""Regulile variantelor jocului, fără fereastră și fără efecte la import.
+
+Fiecare modul (claude, gemini, chatgpt, perplexity, copilot) are constantele
+și logica unei variante; scripturile cu același nume din rădăcina
+proiectului deschid fereastra și rulează bucla jocului peste ele. Doar
+dodge.claude importă pygame (pentru Rect și constantele tastelor), fără să
+inițializeze vreun subsistem.
+"""
@@ -0,0 +1,46 @@
+import random
+
+from patterns import pattern_library
+
+# Configurări fereastră
+WIDTH, HEIGHT = 320, 240
+
+# Player
+player_size = 16
+player_speed = 3
+
+# Blocuri
+block_size = 32
+block_speed = 2
+spawn_delay = 1000  # ms între două rânduri de blocuri
+
+# Patternuri de generare, schimbate la fiecare 10 secunde
+patterns = ['line', 'zigzag', 'grid']
+PATTERN_DURATION = 10000
+
+def spawn_positions(pattern, rng=random, now=0):
+    """Coordonatele x ale blocurilor unui rând nou; `now` (ms) alternează coloanele zigzag-ului"""
+    library = pattern_library(WIDTH, block_size)
+    if pattern == 'line':
+        # Adaugă o „poartă” (gol) aleatorie de 1 sau 2 blocuri
+        gate_start = rng.randint(1, library.columns - 2)  # evită marginile
+        gate_width = rng.choice([1, 2])  # lățimea porții în blocuri
+        row = library.gates(gate_width)[gate_start]
+
+    elif pattern == 'zigzag':
+        # Blocuri din două în două coloane, alternând pe coloanele impare și pare
+        row = library.alternating[1 if (now // 500) % 2 == 0 else 0]
+
+    elif pattern == 'grid':
+        return library.random_positions(rng, 0.5, stride=2)
+
+    else:
+        return []
+
+    return library.positions(row)
+
+def pattern_streams(rng=random):
+    """RowStream-uri pentru 'line' și 'grid'; rândul zigzag-ului depinde doar de `now`"""
+    library = pattern_library(WIDTH, block_size)
+    return {pattern: library.stream(lambda pattern=pattern: spawn_positions(pattern, rng))
+            for pattern in ('line', 'grid')}
@@ -0,0 +1,805 @@
+import math
+import random
+from collections import namedtuple
+
+import numpy as np
+import pygame
+
+from entity_store import EntityStore, column_property
+from particles import ParticleEmitter, ParticlePool, IMPACT, EXPLOSION, PICKUP
+from spatial import ColumnBuckets
+from sampling import SlidingHistogram
+from tracing import tracer
+from events import BLOCK_AVOIDED, POWERUP_COLLECTED, DAMAGE_TAKEN, GAME_OVER_EVENT
+
+# Constante
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+PLAYER_SIZE = 16
+BLOCK_SIZE = 32
+POWERUP_SIZE = 24
+PLAYER_SPEED = 3
+INITIAL_BLOCK_SPEED = 3
+GRID_COLUMNS = 20  # Numărul de coloane în grid-ul virtual
+COLUMN_WIDTH = SCREEN_WIDTH // GRID_COLUMNS
+MAX_SIMULTANEOUS_BLOCKS = 15  
+POSITION_HISTORY_LENGTH = 10  # Pozițiile jucătorului păstrate pentru regresia probabilistică
+POSITION_SEGMENTS = 8  # Ecranul e împărțit în 8 segmente
+FPS = 60  # Ritmul fix al simulării, în tick-uri pe secundă; vitezele sunt în pixeli pe tick
+
+# Duratele efectelor, în milisecunde (independente de ritmul cadrelor)
+SHIELD_DURATION = 3000
+INVINCIBILITY_DURATION = 1000
+SLOW_TIME_DURATION = 5000
+DOUBLE_POINTS_DURATION = 10000
+SCREEN_FLASH_DURATION = 300
+POSITION_SAMPLE_INTERVAL = 500  # Istoricul pozițiilor se completează de două ori pe secundă
+BLINK_INTERVAL = 50  # Clipirea jucătorului cu scut sau invincibil
+
+# Paleta de culori extinsă
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+GRAY = (128, 128, 128)
+DARK_GRAY = (64, 64, 64)
+GREEN = (0, 255, 0)
+BLUE = (100, 150, 255)  # Pentru Shield
+YELLOW = (255, 255, 0)  # Pentru Slow Time
+GOLD = (255, 215, 0)    # Pentru Double Points
+RED = (255, 100, 100)   # Pentru inimi
+
+# Stări joc
+MENU = 0
+GAME = 1
+GAME_OVER = 2
+
+# Tipuri Power-ups
+POWERUP_SHIELD = 0
+POWERUP_SLOW = 1
+POWERUP_DOUBLE = 2
+
+# Skin-uri din assets/: blocurile devin inamici animați, jucătorul un pui
+PLAYER_SKIN = "Chicken"
+ENEMY_SKINS = [("Bat", "Flying"), ("Bee", "Idle"), ("FatBird", "Fall")]
+SKIN_SCALES = {"Chicken": 0.5, "FatBird": 0.75}
+
+# Efectul de particule la colectarea fiecărui tip de power-up
+PICKUP_EFFECTS = {
+    powerup_type: ParticleEmitter(PICKUP.count, PICKUP.speed_x, PICKUP.speed_y, PICKUP.life,
+                                  PICKUP.sizes, color, PICKUP.gravity)
+    for powerup_type, color in ((POWERUP_SHIELD, BLUE), (POWERUP_SLOW, YELLOW), (POWERUP_DOUBLE, GOLD))
+}
+
+class Block:
+    # Vedere peste un rând din EntityStore
+    x = column_property("x")
+    y = column_property("y")
+    speed = column_property("speed")
+    size = column_property("size")
+    
+    def __init__(self, x, y, speed, store=None, size=BLOCK_SIZE):
+        if store is None:
+            store = EntityStore(capacity=1)
+        store.add(self, x, y, speed=speed, size=size)
+        self.column = x // COLUMN_WIDTH  # Coloana pe care se află blocul
+        self.rect = pygame.Rect(x, y, size, size)  # Refolosit de get_rect
+        
+    @classmethod
+    def detached(cls):
+        """View fără rând, legat ulterior de EntityStore.restore (coloana se setează de apelant)"""
+        view = cls.__new__(cls)
+        view.rect = pygame.Rect(0, 0, BLOCK_SIZE, BLOCK_SIZE)
+        return view
+        
+    def update(self):
+        self.y += self.speed
+        
+    def draw(self, screen, alpha=1.0):
+        body = self.get_rect()
+        if alpha < 1.0:
+            body.y = self.interpolated_y(alpha)
+        rect = pygame.draw.rect(screen, GRAY, body)
+        pygame.draw.rect(screen, BLACK, body, 2)
+        return rect
+        
+    def interpolated_y(self, alpha):
+        # Coloana `speed` păstrează viteza ultimului tick, deci poziția anterioară e y - speed
+        if alpha >= 1.0:
+            return self.y
+        return self.y - self.speed * (1 - alpha)
+        
+    def get_rect(self):
+        # Același Rect la fiecare apel, actualizat pe loc; nu trebuie păstrat de apelant
+        self.rect.update(self.x, self.y, self.size, self.size)
+        return self.rect
+    
+    def is_completely_off_screen(self):
+        """Verifică dacă blocul a trecut COMPLET de marginea inferioară"""
+        return self.y > SCREEN_HEIGHT
+
+class PowerUp(Block):  # Moștenește din Block pentru DRY principle
+    type = column_property("kind")
+    pulse = column_property("pulse")
+    
+    def __init__(self, x, y, powerup_type, speed, store=None):
+        if store is None:
+            store = EntityStore(capacity=1, pulse_step=0.15)
+        super().__init__(x, y, speed, store, POWERUP_SIZE)
+        self.type = powerup_type
+        
+    def update(self):
+        super().update()  # Folosește logica de mișcare din Block
+        self.pulse += 0.15
+        
+    def draw(self, screen, alpha=1.0):
+        # Efect de puls: un singur blit al cadrului pre-randat pentru faza curentă
+        phase = int(self.pulse * PULSE_PHASES / (2 * math.pi)) % PULSE_PHASES
+        current_size = self.size + PULSE_OFFSETS[phase]
+        return screen.blit(powerup_sprites.get(self.type, current_size), (self.x, self.interpolated_y(alpha)))
+
+# Offset-ul pulsului (int(sin * 2)) pre-calculat la mijlocul fiecărei faze
+PULSE_PHASES = 64
+PULSE_OFFSETS = [int(math.sin(2 * math.pi * (phase + 0.5) / PULSE_PHASES) * 2) for phase in range(PULSE_PHASES)]
+
+class PowerUpSprites:
+    """Cadrele animației power-up-urilor, randate o singură dată pentru fiecare tip și mărime"""
+    def __init__(self):
+        self.frames = {}
+        
+    def get(self, powerup_type, size):
+        frame = self.frames.get((powerup_type, size))
+        if frame is None:
+            frame = self.bake(powerup_type, size)
+            self.frames[(powerup_type, size)] = frame
+        return frame
+    
+    def bake_all(self, base_size=POWERUP_SIZE):
+        """Randează dinainte toate mărimile pulsului pentru toate tipurile"""
+        for powerup_type in (POWERUP_SHIELD, POWERUP_SLOW, POWERUP_DOUBLE):
+            for offset in set(PULSE_OFFSETS):
+                self.get(powerup_type, base_size + offset)
+    
+    def bake(self, powerup_type, size):
+        surface = pygame.Surface((size, size))
+        
+        # Culoare bazată pe tip
+        if powerup_type == POWERUP_SHIELD:
+            color = BLUE
+        elif powerup_type == POWERUP_SLOW:
+            color = YELLOW
+        else:  # POWERUP_DOUBLE
+            color = GOLD
+            
+        # Desenează background-ul power-up-ului
+        pygame.draw.rect(surface, color, (0, 0, size, size))
+        pygame.draw.rect(surface, BLACK, (0, 0, size, size), 2)
+        
+        # Desenează iconița specifică
+        center_x = size // 2
+        center_y = size // 2
+        
+        if powerup_type == POWERUP_SHIELD:
+            # Desenează scut
+            points = [
+                (center_x, center_y - 6),
+                (center_x - 4, center_y - 2),
+                (center_x - 4, center_y + 2),
+                (center_x, center_y + 6),
+                (center_x + 4, center_y + 2),
+                (center_x + 4, center_y - 2)
+            ]
+            pygame.draw.polygon(surface, BLACK, points, 2)
+            
+        elif powerup_type == POWERUP_SLOW:
+            # Desenează ceas
+            pygame.draw.circle(surface, BLACK, (center_x, center_y), 6, 2)
+            pygame.draw.line(surface, BLACK, (center_x, center_y), (center_x, center_y - 4), 2)
+            pygame.draw.line(surface, BLACK, (center_x, center_y), (center_x + 3, center_y), 2)
+            
+        else:  # POWERUP_DOUBLE
+            # Desenează stea
+            star_points = []
+            for i in range(10):
+                angle = i * math.pi / 5
+                if i % 2 == 0:
+                    radius = 6
+                else:
+                    radius = 3
+                x = center_x + radius * math.cos(angle - math.pi/2)
+                y = center_y + radius * math.sin(angle - math.pi/2)
+                star_points.append((x, y))
+            pygame.draw.polygon(surface, BLACK, star_points)
+            
+        return surface
+
+powerup_sprites = PowerUpSprites()
+
+class GridManager:
+    """Gestionează grid-ul virtual pentru a evita suprapunerea blocurilor.
+
+    Ocuparea se ține incremental: un contor de entități pe fiecare coloană și o
+    mască de biți cu coloanele ocupate. O coloană se ocupă la spawn și se
+    eliberează când entitatea coboară sub SCREEN_HEIGHT // 3 sau dispare.
+    """
+    def __init__(self, columns=GRID_COLUMNS):
+        self.columns = columns
+        self.column_counts = [0] * columns
+        self.occupied_mask = 0
+        self.all_columns_mask = (1 << columns) - 1
+        
+    @property
+    def occupied_columns(self):
+        return set(self._columns_in(self.occupied_mask))
+    
+    @property
+    def free_mask(self):
+        return self.all_columns_mask & ~self.occupied_mask
+    
+    def free_count(self):
+        """Numărul de coloane libere"""
+        return self.free_mask.bit_count()
+    
+    def is_free(self, column):
+        return not (self.occupied_mask >> column) & 1
+        
+    def get_free_columns(self):
+        """Returnează coloanele libere"""
+        return self._columns_in(self.free_mask)
+    
+    def occupy_column(self, column):
+        """Marchează o coloană ca ocupată"""
+        self.column_counts[column] += 1
+        self.occupied_mask |= 1 << column
+    
+    def free_column(self, column):
+        """Eliberează o coloană"""
+        if self.column_counts[column] > 0:
+            self.column_counts[column] -= 1
+            if self.column_counts[column] == 0:
+                self.occupied_mask &= ~(1 << column)
+    
+    def clear(self):
+        self.column_counts = [0] * self.columns
+        self.occupied_mask = 0
+    
+    def update_from_blocks(self, blocks):
+        """Reconstruiește complet grid-ul din blocurile active"""
+        self.clear()
+        for block in blocks:
+            # Consideră o coloană ocupată dacă blocul e încă în partea de sus a ecranului
+            if block.y < SCREEN_HEIGHT // 3:
+                self.occupy_column(int(block.x // COLUMN_WIDTH))
+    
+    def update_from_stores(self, *stores):
+        """Ca update_from_blocks, dar citește direct coloanele din EntityStore"""
+        self.clear()
+        for store in stores:
+            n = len(store)
+            near_top = store.y[:n] < SCREEN_HEIGHT // 3
+            for column in (store.x[:n][near_top] // COLUMN_WIDTH).astype(int).tolist():
+                self.occupy_column(column)
+    
+    @staticmethod
+    def choose_column(rng, mask):
+        """O coloană aleatorie din `mask`, cu aceeași extragere ca rng.choice(_columns_in(mask))"""
+        index = rng.randrange(mask.bit_count())
+        for _ in range(index):
+            mask &= mask - 1
+        return (mask & -mask).bit_length() - 1
+
+    @staticmethod
+    def _columns_in(mask):
+        columns = []
+        while mask:
+            lowest = mask & -mask
+            columns.append(lowest.bit_length() - 1)
+            mask ^= lowest
+        return columns
+
+def position_segment(position):
+    """Segmentul ecranului în care se află o poziție orizontală"""
+    return max(0, min(POSITION_SEGMENTS - 1, int(position // (SCREEN_WIDTH // POSITION_SEGMENTS))))
+
+class Player:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.prev_x = x
+        self.prev_y = y
+        self.size = int(PLAYER_SIZE * 0.9)  # Reducere hitbox cu 10%
+        self.visual_size = PLAYER_SIZE  # Păstrează dimensiunea vizuală
+        # Dreptunghiuri refolosite în fiecare cadru (desen și hitbox)
+        self.visual_rect = pygame.Rect(x, y, self.visual_size, self.visual_size)
+        self.rect = pygame.Rect(x, y, self.size, self.size)
+        self.speed = PLAYER_SPEED
+        self.hp = 3
+        self.max_hp = 3
+        
+        # Power-up states
+        self.shield_active = False
+        self.shield_timer = 0
+        self.invincible = False
+        self.invincible_timer = 0
+        self.flash_timer = 0
+        
+        # Pentru animația skin-ului
+        self.moving = False
+        self.facing_right = False
+        
+        # Pentru tracking poziție (regresie probabilistică)
+        self.position_history = SlidingHistogram(POSITION_SEGMENTS, POSITION_HISTORY_LENGTH, position_segment)
+        self.position_timer = 0
+        
+    def update(self, keys, dt):
+        # Poziția de la tick-ul anterior, pentru desenarea interpolată
+        self.prev_x = self.x
+        self.prev_y = self.y
+        
+        # Controlul WASD
+        if keys[pygame.K_w] and self.y > 0:
+            self.y -= self.speed
+        if keys[pygame.K_s] and self.y < SCREEN_HEIGHT - self.visual_size:
+            self.y += self.speed
+        if keys[pygame.K_a] and self.x > 0:
+            self.x -= self.speed
+        if keys[pygame.K_d] and self.x < SCREEN_WIDTH - self.visual_size:
+            self.x += self.speed
+        
+        self.moving = keys[pygame.K_w] or keys[pygame.K_a] or keys[pygame.K_s] or keys[pygame.K_d]
+        if keys[pygame.K_a] != keys[pygame.K_d]:
+            self.facing_right = bool(keys[pygame.K_d])
+            
+        # Actualizează istoricul poziției pentru regresie probabilistică
+        self.position_timer += dt
+        if self.position_timer >= POSITION_SAMPLE_INTERVAL:
+            # Păstrează ultimele POSITION_HISTORY_LENGTH poziții, cu numărătorile pe segmente
+            self.position_history.push(self.x + self.visual_size // 2)
+            self.position_timer = 0
+            
+        # Actualizează power-up-uri (timer-ele sunt în milisecunde)
+        if self.shield_active:
+            self.shield_timer -= dt
+            self.flash_timer += dt
+            if self.shield_timer <= 0:
+                self.shield_active = False
+                
+        if self.invincible:
+            self.invincible_timer -= dt
+            self.flash_timer += dt
+            if self.invincible_timer <= 0:
+                self.invincible = False
+    
+    def blinking(self):
+        """Ascuns în cadrul curent al clipirii (cu scut sau invincibil)"""
+        return (self.invincible or self.shield_active) and (self.flash_timer // BLINK_INTERVAL) % 2 == 0
+    
+    def draw(self, screen, alpha=1.0):
+        # Flash effect când e invincibil sau cu scut
+        if self.blinking():
+            return
+            
+        # Alege culoarea bazată pe starea power-up-ului
+        if self.shield_active:
+            color = BLUE
+        else:
+            color = WHITE
+            
+        body = self.visual_rect
+        body.topleft = self.interpolated_position(alpha)
+        rect = pygame.draw.rect(screen, color, body)
+        pygame.draw.rect(screen, BLACK, body, 2)
+        return rect
+    
+    def interpolated_position(self, alpha):
+        """Poziția între tick-ul anterior (alpha = 0) și cel curent (alpha = 1)"""
+        return (round(self.prev_x + (self.x - self.prev_x) * alpha),
+                round(self.prev_y + (self.y - self.prev_y) * alpha))
+    
+    def get_rect(self):
+        # Folosește dimensiunea redusă pentru coliziuni; Rect-ul e refolosit, nu realocat
+        offset = (self.visual_size - self.size) // 2
+        self.rect.topleft = (self.x + offset, self.y + offset)
+        return self.rect
+        
+    def activate_shield(self, duration):
+        self.shield_active = True
+        self.shield_timer = duration
+        self.flash_timer = 0
+        
+    def take_damage(self):
+        if not self.invincible and not self.shield_active:
+            self.hp -= 1
+            self.invincible = True
+            self.invincible_timer = INVINCIBILITY_DURATION
+            self.flash_timer = 0
+            return True
+        return False
+    
+    def get_position_weights(self):
+        """Returnează ponderile pentru regresie probabilistică"""
+        if len(self.position_history) < 3:
+            return {}
+            
+        # Frecvența poziției jucătorului în segmente, ținută la zi de position_history
+        counts = self.position_history.counts
+        total = len(self.position_history)
+        return {segment: count / total for segment, count in enumerate(counts) if count}
+
+# Măștile de coloane folosite la spawn: jumătățile ecranului și coloanele fiecărui segment
+LEFT_HALF_MASK = (1 << (GRID_COLUMNS // 2)) - 1
+RIGHT_HALF_MASK = ((1 << GRID_COLUMNS) - 1) & ~LEFT_HALF_MASK
+COLUMNS_PER_SEGMENT = GRID_COLUMNS // POSITION_SEGMENTS
+SEGMENT_COLUMN_MASKS = tuple(((1 << COLUMNS_PER_SEGMENT) - 1) << (segment * COLUMNS_PER_SEGMENT)
+                             for segment in range(POSITION_SEGMENTS))
+
+class ProbabilisticGenerator:
+    def __init__(self, rng=None):
+        # Sursa de aleatorism e injectabilă: cu același seed, aceleași spawn-uri (replay-uri)
+        self.rng = rng if rng is not None else random.Random()
+        self.spawn_timer = 0
+        self.next_spawn_time = self.rng.randint(500, 1500)  # 0.5-1.5 secunde
+        
+    def update(self, dt, player):
+        self.spawn_timer += dt
+        
+    def should_spawn_block(self):
+        if self.spawn_timer >= self.next_spawn_time:
+            self.spawn_timer = 0
+            self.next_spawn_time = self.rng.randint(500, 1500)
+            return True
+        return False
+        
+    def get_spawn_positions(self, player, grid_manager, current_blocks_count):
+        """Generează poziții bazate pe regresie probabilistică și grid management"""
+        rng = self.rng
+        positions = []
+        
+        # Verifică câte blocuri mai putem spawna
+        max_new_blocks = MAX_SIMULTANEOUS_BLOCKS - current_blocks_count
+        if max_new_blocks <= 0:
+            return positions
+        
+        # Coloanele libere, ca mască de biți
+        free_mask = grid_manager.free_mask
+        if not free_mask:
+            return positions
+        
+        # Tabelul alias al segmentelor frecventate; se reconstruiește doar când histograma se schimbă
+        history = player.position_history
+        segment_table = history.alias_table() if len(history) >= 3 else None
+        
+        # Determină numărul de blocuri (1-3, dar limitat de spațiul disponibil)
+        num_blocks = min(rng.randint(1, 3), free_mask.bit_count(), max_new_blocks)
+        
+        # Pentru power-ups, prioritizează zone sigure (opus jucătorului)
+        player_center = player.x + player.visual_size // 2
+        safe_mask = RIGHT_HALF_MASK if player_center < SCREEN_WIDTH // 2 else LEFT_HALF_MASK
+        
+        for i in range(num_blocks):
+            # 5% șansă să fie power-up (redus de la 10%)
+            is_powerup = rng.random() < 0.05
+            
+            if is_powerup:
+                # Power-up-uri spawn în zone sigure, dacă au coloane libere
+                chosen_column = GridManager.choose_column(rng, (free_mask & safe_mask) or free_mask)
+            elif segment_table is not None and rng.random() < 0.3:  # 30% șansă să folosim regresie
+                # Zonele frecventate au probabilitate mai mare; segmentul se mapează la coloane
+                segment = segment_table.sample(rng)
+                segment_free = free_mask & SEGMENT_COLUMN_MASKS[segment]
+                chosen_column = GridManager.choose_column(rng, segment_free or free_mask)
+            else:
+                # Poziție complet aleatorie
+                chosen_column = GridManager.choose_column(rng, free_mask)
+            
+            x = chosen_column * COLUMN_WIDTH + rng.randint(0, COLUMN_WIDTH - BLOCK_SIZE)
+            x = max(0, min(x, SCREEN_WIDTH - BLOCK_SIZE))
+            positions.append((x, is_powerup))
+            
+            # Elimină coloana din coloanele libere pentru această sesiune de spawn
+            free_mask &= ~(1 << chosen_column)
+            if not free_mask:
+                break
+            
+        return positions
+
+# Atributele care descriu complet starea jucătorului și a sesiunii (pentru keyframe-uri)
+PLAYER_STATE_FIELDS = ("x", "y", "hp", "max_hp", "shield_active", "shield_timer", "invincible",
+                       "invincible_timer", "flash_timer", "moving", "facing_right",
+                       "position_history", "position_timer")
+SESSION_STATE_FIELDS = ("blocks_avoided", "powerups_collected", "score", "base_score", "elapsed_time", "frame_count",
+                        "game_over", "current_speed", "speed_increase_timer", "slow_time_active",
+                        "slow_time_timer", "double_points_active", "double_points_timer",
+                        "screen_flash_timer")
+
+# Starea făcută de Simulation.snapshot(): tupluri de scalari și tablouri NumPy, fără obiecte pygame
+Snapshot = namedtuple("Snapshot", "player position_history session blocks powerups particles "
+                                  "generator grid rng")
+SNAPSHOT_PLAYER_FIELDS = tuple(name for name in PLAYER_STATE_FIELDS if name != "position_history") + ("prev_x", "prev_y")
+
+class Simulation:
+    """Starea și regulile jocului, fără afișaj și fără ceas real.
+
+    Avansează cu `step(keys, dt)`: `keys` se indexează cu constantele pygame.K_*,
+    iar `dt` este durata tick-ului în milisecunde. Astfel aceeași logică rulează
+    atât în fereastra jocului, cât și headless (vezi headless.py).
+    """
+    def __init__(self, event_log=None, rng=None):
+        # Evenimentele de joc merg într-un events.EventLog, scris pe un fir separat; None = fără jurnal
+        self.event_log = event_log
+        # Tot aleatorismul simulării vine din `rng`; seed-ul se dă la reset_game
+        self.rng = rng if rng is not None else random.Random()
+        self.particles = ParticlePool()  # Refolosit între sesiuni, împreună cu sprite-urile
+        self.reset_game()
+        
+    def reset_game(self, seed=None):
+        """Începe o sesiune nouă; cu `seed` sesiunea e reproductibilă (vezi replay.py)"""
+        if seed is not None:
+            self.rng.seed(seed)
+        self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50)
+        self.blocks_avoided = 0
+        self.powerups_collected = 0
+        # Entitățile sunt ținute pe coloane NumPy și actualizate vectorizat;
+        # coliziunile se caută doar în coloanele grid-ului atinse de jucător
+        self.blocks = EntityStore(index=ColumnBuckets(SCREEN_WIDTH, COLUMN_WIDTH))
+        self.particles.clear()
+        self.powerups = EntityStore(pulse_step=0.15, index=ColumnBuckets(SCREEN_WIDTH, COLUMN_WIDTH))
+        self.generator = ProbabilisticGenerator(self.rng)
+        self.grid_manager = GridManager()
+        
+        self.score = 0
+        self.base_score = 0  # Scorul de bază (fără multiplicatori)
+        self.elapsed_time = 0  # Milisecunde simulate de la începutul sesiunii
+        self.frame_count = 0
+        self.game_over = False
+        self.current_speed = INITIAL_BLOCK_SPEED
+        self.speed_increase_timer = 0
+        
+        # Power-up timers
+        self.slow_time_active = False
+        self.slow_time_timer = 0
+        self.double_points_active = False
+        self.double_points_timer = 0
+        
+        self.screen_flash_timer = 0  # Pentru efectul de puls roșu
+        
+    def step(self, keys, dt):
+        """Avansează simularea cu un tick de `dt` milisecunde.
+
+        Mișcarea e în pixeli pe tick, deci tick-urile trebuie să vină în
+        ritmul fix FPS (vezi frame_dt și Game.advance); timer-ele se scad
+        cu `dt` și sunt în milisecunde.
+        """
+        self.frame_count += 1
+        self.elapsed_time += dt
+        
+        # Actualizează personajul
+        self.player.update(keys, dt)
+        
+        # Actualizează flash-ul ecranului
+        if self.screen_flash_timer > 0:
+            self.screen_flash_timer = max(0, self.screen_flash_timer - dt)
+        
+        # Actualizează timer-ul de viteză
+        self.speed_increase_timer += dt
+        if self.speed_increase_timer >= 30000:
+            self.current_speed += 1
+            self.speed_increase_timer = 0
+        
+        # Actualizează power-up timers
+        if self.slow_time_active:
+            self.slow_time_timer -= dt
+            if self.slow_time_timer <= 0:
+                self.slow_time_active = False
+                
+        if self.double_points_active:
+            self.double_points_timer -= dt
+            if self.double_points_timer <= 0:
+                self.double_points_active = False
+        
+        # Actualizează generatorul probabilistic
+        self.generator.update(dt, self.player)
+        
+        # Spawnează blocuri și power-ups
+        if self.generator.should_spawn_block():
+            with tracer.span("spawn"):
+                current_blocks_count = len(self.blocks) + len(self.powerups)
+                with tracer.span("get_spawn_positions"):
+                    positions = self.generator.get_spawn_positions(self.player, self.grid_manager, current_blocks_count)
+            
+                for x, is_powerup in positions:
+                    if is_powerup:
+                        powerup_type = self.rng.randint(0, 2)
+                        speed = self.current_speed * 0.5 if self.slow_time_active else self.current_speed
+                        entity = PowerUp(x, -POWERUP_SIZE, powerup_type, speed, self.powerups)
+                    else:
+                        speed = self.current_speed * 0.5 if self.slow_time_active else self.current_speed
+                        entity = Block(x, -BLOCK_SIZE, speed, self.blocks)
+                    self.grid_manager.occupy_column(entity.column)
+        
+        # Actualizează blocurile și verifică dacă au ieșit complet de pe ecran
+        # Aplică slow time effect (blocuri și power-ups)
+        with tracer.span("entities"):
+            speed = self.current_speed * 0.5 if self.slow_time_active else self.current_speed
+            self.move_entities(self.blocks, speed)
+        
+            # Elimină în bloc blocurile care au trecut COMPLET de marginea de jos
+            avoided = self.blocks.remove_where(self.blocks.y[:len(self.blocks)] > SCREEN_HEIGHT)
+            for _ in range(avoided):
+                # PUNCTAJ: Adaugă puncte doar când blocul trece complet de ecran
+                points_to_add = 2 if self.double_points_active else 1
+                self.blocks_avoided += points_to_add
+                self.emit(BLOCK_AVOIDED, points=points_to_add, total=self.blocks_avoided)
+                
+            # Actualizează power-ups; nu dau puncte când trec de ecran
+            self.move_entities(self.powerups, speed)
+            self.powerups.remove_where(self.powerups.y[:len(self.powerups)] > SCREEN_HEIGHT)
+                
+        # Actualizează particulele
+        with tracer.span("particles"):
+            self.update_particles()
+        
+        # Verifică coliziunile cu power-ups
+        with tracer.span("collisions"):
+            player_rect = self.player.get_rect()
+            for powerup in self.powerups.colliding(player_rect):
+                if powerup.type == POWERUP_SHIELD:
+                    self.player.activate_shield(SHIELD_DURATION)
+                elif powerup.type == POWERUP_SLOW:
+                    self.slow_time_active = True
+                    self.slow_time_timer = SLOW_TIME_DURATION
+                elif powerup.type == POWERUP_DOUBLE:
+                    self.double_points_active = True
+                    self.double_points_timer = DOUBLE_POINTS_DURATION
+                
+                self.powerups_collected += 1
+                self.emit(POWERUP_COLLECTED, type=powerup.type)
+                self.particles.emit(PICKUP_EFFECTS[powerup.type],
+                                    self.player.x + self.player.visual_size//2,
+                                    self.player.y + self.player.visual_size//2)
+                self.remove_entity(self.powerups, powerup)
+                break
+        
+            # Verifică coliziunile cu blocurile
+            for block in self.blocks.colliding(player_rect):
+                if self.player.take_damage():
+                    # Efectul de flash roșu
+                    self.screen_flash_timer = SCREEN_FLASH_DURATION
+                
+                    # Creează particule de impact
+                    center_x = self.player.x + self.player.visual_size//2
+                    center_y = self.player.y + self.player.visual_size//2
+                    self.particles.emit(IMPACT, center_x, center_y)
+                    self.remove_entity(self.blocks, block)
+                    self.emit(DAMAGE_TAKEN, hp=self.player.hp)
+                
+                    # Verifică game over
+                    if self.player.hp <= 0:
+                        self.game_over = True
+                        self.particles.emit(EXPLOSION, center_x, center_y)
+                    break
+                
+        # Calculează scorul
+        current_time = self.elapsed_time // 1000
+        base_time_score = current_time
+        total_score = base_time_score + self.blocks_avoided
+
+        if self.double_points_active:
+            # Aplică bonusul doar la punctele din timp, nu la blocurile evitate
+            # (blocurile evitate deja au bonusul aplicat când sunt evitate)
+            self.score = (base_time_score * 2) + self.blocks_avoided
+        else:
+            self.score = total_score
+            
+        if self.game_over:
+            self.emit(GAME_OVER_EVENT, score=self.score, blocks_avoided=self.blocks_avoided)
+
+    def emit(self, kind, **fields):
+        """Trimite un eveniment de joc în jurnal, fără I/O în bucla cadrului"""
+        if self.event_log is not None:
+            self.event_log.emit(kind, self.frame_count, **fields)
+
+    def state_dict(self):
+        """Starea completă a sesiunii ca valori Python simple (serializabile JSON).
+
+        Cuprinde jucătorul, blocurile, power-up-urile, timer-ele, grid-ul și
+        starea generatorului aleator. Particulele sunt doar vizuale, au
+        generatorul lor și nu fac parte din stare.
+        """
+        player = {name: getattr(self.player, name) for name in PLAYER_STATE_FIELDS}
+        player["position_history"] = list(self.player.position_history)
+        return {
+            "player": player,
+            "session": {name: getattr(self, name) for name in SESSION_STATE_FIELDS},
+            "blocks": [(int(block.x), block.y, block.speed) for block in self.blocks],
+            "powerups": [(int(powerup.x), powerup.y, powerup.speed, powerup.type, powerup.pulse)
+                         for powerup in self.powerups],
+            "generator": (self.generator.spawn_timer, self.generator.next_spawn_time),
+            "grid": list(self.grid_manager.column_counts),
+            "rng": self.rng.getstate(),
+        }
+
+    def load_state_dict(self, state):
+        """Reface o stare salvată cu `state_dict()` (de ex. un keyframe din replay)"""
+        self.reset_game()
+        for name, value in state["player"].items():
+            if name == "position_history":
+                self.player.position_history.extend(value)
+            else:
+                setattr(self.player, name, value)
+        self.player.prev_x, self.player.prev_y = self.player.x, self.player.y
+        for name, value in state["session"].items():
+            setattr(self, name, value)
+        for x, y, speed in state["blocks"]:
+            Block(x, y, speed, self.blocks)
+        for x, y, speed, powerup_type, pulse in state["powerups"]:
+            PowerUp(x, y, powerup_type, speed, self.powerups).pulse = pulse
+        self.generator.spawn_timer, self.generator.next_spawn_time = state["generator"]
+        for column, count in enumerate(state["grid"]):
+            for _ in range(count):
+                self.grid_manager.occupy_column(column)
+        # JSON transformă tuplurile în liste; random.setstate cere tupluri
+        version, internal, gauss = state["rng"]
+        self.rng.setstate((version, tuple(internal), gauss))
+
+    def snapshot(self, include_rng=True):
+        """Copie compactă a stării complete, pentru lookahead și rollback.
+
+        Spre deosebire de `state_dict()`, nu e serializabilă, dar costă doar
+        microsecunde: scalarii se copiază în tupluri, iar blocurile,
+        power-up-urile și particulele în câte două tablouri NumPy. Generatorul
+        propriu al particulelor nu e inclus (efectele sunt doar vizuale).
+        Același snapshot se poate restaura de oricâte ori cu `restore()`.
+        Fără `include_rng` (de ex. doar pentru desenare) generatorul nu se
+        copiază, iar `restore()` îl lasă neschimbat.
+        """
+        player = self.player
+        grid = self.grid_manager
+        return Snapshot(
+            tuple([getattr(player, name) for name in SNAPSHOT_PLAYER_FIELDS]),
+            player.position_history.snapshot(),
+            tuple([getattr(self, name) for name in SESSION_STATE_FIELDS]),
+            self.blocks.snapshot(),
+            self.powerups.snapshot(),
+            self.particles.snapshot(),
+            (self.generator.spawn_timer, self.generator.next_spawn_time),
+            (tuple(grid.column_counts), grid.occupied_mask),
+            self.rng.getstate() if include_rng else None,
+        )
+
+    def restore(self, snapshot):
+        """Readuce simularea exact în starea din `snapshot()`; obiectele existente se refolosesc"""
+        player = self.player
+        for name, value in zip(SNAPSHOT_PLAYER_FIELDS, snapshot.player):
+            setattr(player, name, value)
+        player.position_history.restore(snapshot.position_history)
+        for name, value in zip(SESSION_STATE_FIELDS, snapshot.session):
+            setattr(self, name, value)
+        for store, rows, view_type in ((self.blocks, snapshot.blocks, Block),
+                                       (self.powerups, snapshot.powerups, PowerUp)):
+            store.restore(rows, view_type.detached)
+            if len(store):
+                for view, column in zip(store.views, (store.x[:len(store)] // COLUMN_WIDTH).astype(int).tolist()):
+                    view.column = column
+        self.particles.restore(snapshot.particles)
+        self.generator.spawn_timer, self.generator.next_spawn_time = snapshot.generator
+        column_counts, self.grid_manager.occupied_mask = snapshot.grid
+        self.grid_manager.column_counts = list(column_counts)
+        if snapshot.rng is not None:
+            self.rng.setstate(snapshot.rng)
+
+    def move_entities(self, store, speed):
+        """Mișcă blocurile/power-ups și eliberează coloanele celor care coboară sub prima treime"""
+        limit = SCREEN_HEIGHT // 3
+        near_top = store.y[:len(store)] < limit
+        store.set_speed(speed)
+        store.step()
+        crossed = near_top & (store.y[:len(store)] >= limit)
+        for row in np.flatnonzero(crossed):
+            self.grid_manager.free_column(store[row].column)
+    
+    def remove_entity(self, store, entity):
+        if entity.y < SCREEN_HEIGHT // 3:
+            self.grid_manager.free_column(entity.column)
+        store.remove(entity)
+    
+    def update_particles(self):
+        self.particles.update()
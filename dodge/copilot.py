@@ -0,0 +1,32 @@
+import random
+
+from patterns import pattern_library
+
+WIDTH, HEIGHT = 480, 640
+
+# Personaj
+player_size = 16
+player_speed = 4
+
+# Blocuri
+block_size = 32
+block_speed = 4
+spawn_patterns = ['line', 'zigzag', 'grid']
+SPAWN_INTERVAL = 1000  # ms între două rânduri
+PATTERN_DURATION = 10000  # ms până la schimbarea pattern-ului
+
+def generate_block_positions(pattern, rng=random):
+    library = pattern_library(WIDTH, block_size)
+    if pattern == 'line':
+        return library.random_positions(rng, 0.8)  # ~80% șansă să apară un bloc
+    elif pattern == 'zigzag':
+        return library.positions(library.alternating[1])  # Coloanele impare
+    elif pattern == 'grid':
+        return library.random_positions(rng, 0.5, stride=2)
+    return []
+
+def pattern_streams(rng=random):
+    """Câte un RowStream (cu peek) pentru fiecare pattern din spawn_patterns"""
+    library = pattern_library(WIDTH, block_size)
+    return {pattern: library.stream(lambda pattern=pattern: generate_block_positions(pattern, rng))
+            for pattern in spawn_patterns}
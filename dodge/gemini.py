@@ -0,0 +1,58 @@
+import random
+
+from patterns import pattern_library
+
+# --- Setări joc ---
+SCREEN_WIDTH = 600
+SCREEN_HEIGHT = 800
+FPS = 60
+GAME_DURATION_FOR_PATTERN_CHANGE = 10  # secunde
+
+# --- Proprietăți jucător ---
+PLAYER_SIZE = 16
+PLAYER_SPEED = 5
+
+# --- Proprietăți blocuri ---
+BLOCK_SIZE = 32
+BLOCK_SPEED = 3
+INITIAL_BLOCK_SPAWN_INTERVAL = 700  # milisecunde (mai lent la început)
+MIN_BLOCK_SPAWN_INTERVAL = 200      # milisecunde (limita inferioară)
+DIFFICULTY_INCREASE_INTERVAL = 50   # Cu cât scade intervalul la fiecare 50 de puncte acumulate
+
+# --- Funcții pentru generarea pattern-urilor ---
+def generate_line_pattern(width, block_size, excluded_column=None, rng=random):
+    library = pattern_library(width, block_size)
+    # Asigură-te că există o coloană liberă
+    if excluded_column is None:
+        excluded_column = rng.randint(0, library.columns - 1)
+    return library.positions(library.single_gaps[excluded_column])
+
+def generate_zigzag_pattern(width, block_size, current_step):
+    # Calea liberă se mișcă de la stânga la dreapta și înapoi; rândurile
+    # pentru toată perioada sunt pre-calculate în bibliotecă
+    library = pattern_library(width, block_size)
+    return library.positions(library.zigzag_row(current_step))
+
+def generate_grid_pattern(width, block_size, density=0.3, rng=random): # Redu densitatea implicită
+    library = pattern_library(width, block_size)
+    # Alege o coloană liberă aleatorie pentru a garanta o cale
+    free_column = rng.randint(0, library.columns - 1)
+    # Celelalte coloane au șansă să apară
+    return library.random_positions(rng, density, exclude=free_column)
+
+def pattern_streams(rng=random, width=SCREEN_WIDTH, block_size=BLOCK_SIZE, density=0.3):
+    """Rândurile pattern-urilor aleatoare ('line', 'grid') ca RowStream-uri, cu peek.
+
+    Zigzag-ul nu are nevoie de flux: rândul lui ține doar de pas, deci orice
+    rând viitor se citește direct cu generate_zigzag_pattern.
+    """
+    library = pattern_library(width, block_size)
+    return {"line": library.stream(lambda: generate_line_pattern(width, block_size, rng=rng)),
+            "grid": library.stream(lambda: generate_grid_pattern(width, block_size, density, rng))}
+
+# --- Funcție pentru a calcula intervalul curent de spawn ---
+def get_current_spawn_interval(current_score):
+    # Scade intervalul pe măsură ce scorul crește, dar nu sub MIN_BLOCK_SPAWN_INTERVAL
+    reduction = (current_score // 50) * DIFFICULTY_INCREASE_INTERVAL
+    new_interval = max(MIN_BLOCK_SPAWN_INTERVAL, INITIAL_BLOCK_SPAWN_INTERVAL - reduction)
+    return new_interval
@@ -0,0 +1,52 @@
+from patterns import pattern_library
+
+# Setări ecran
+WIDTH, HEIGHT = 320, 480
+FPS = 60
+
+# Player
+PLAYER_SIZE = 16
+player_speed = 5
+
+# Blocuri
+BLOCK_SIZE = 32
+block_speed = 3
+library = pattern_library(WIDTH, BLOCK_SIZE)  # Rândurile pattern-urilor, pre-calculate
+SPAWN_INTERVAL = 800  # ms între două rânduri
+PATTERN_DURATION = 10000  # ms până la pattern-ul următor
+
+# Funcțiile spawn_* iau golurile din `gaps` (library.gap_stream) și întorc
+# (pozițiile (x, y) ale blocurilor rândului, golul sau golurile)
+def spawn_line_pattern(gaps):
+    gap_index = next(gaps)
+    positions = [(x, -BLOCK_SIZE) for x in library.positions(library.single_gaps[gap_index])]
+    return positions, gap_index
+
+def spawn_zigzag_pattern(gaps, now=0):
+    offset = (now // 800) % 2 * (BLOCK_SIZE // 2)
+    gap_index = next(gaps)
+    # Cu offset, pozițiile se reiau de la stânga când ies din ecran
+    positions = [(x, -BLOCK_SIZE) for x in library.positions(library.single_gaps[gap_index], offset)]
+    return positions, gap_index
+
+def spawn_grid_pattern(gaps):
+    num_blocks_y = 2  # două linii
+    row_gaps = [next(gaps) for _ in range(num_blocks_y)]
+    positions = []
+    for row in range(num_blocks_y):
+        y = -BLOCK_SIZE * (row + 1) - 10 * row
+        positions.extend((x, y) for x in library.positions(library.single_gaps[row_gaps[row]]))
+    return positions, row_gaps
+
+def check_row_evaded(row_blocks, player):
+    # Verifică dacă toate blocurile din row_blocks au trecut de player fără coliziune
+    for block in row_blocks:
+        if player.colliderect(block):
+            return False  # A existat o coliziune
+        if block.bottom >= player.top and not player.colliderect(block):
+            continue
+    return True
+
+def is_row_dead(row_blocks):
+    # Toate blocurile din row_blocks au ieșit de pe ecran
+    return all(b.top >= HEIGHT for b in row_blocks)
@@ -0,0 +1,190 @@
+import numpy as np
+
+# Coloanele stocate pentru fiecare entitate (struct-of-arrays)
+FLOAT_COLUMNS = ("x", "y", "speed", "vel_x", "life", "pulse")
+INT_COLUMNS = ("kind", "size")
+COLUMNS = FLOAT_COLUMNS + INT_COLUMNS
+X_ROW = FLOAT_COLUMNS.index("x")
+SIZE_ROW = INT_COLUMNS.index("size")
+
+def column_property(name):
+    """Proprietate care citește/scrie rândul unei entități direct din coloana NumPy"""
+    def getter(view):
+        return getattr(view.store, name)[view.row].item()
+
+    def setter(view, value):
+        getattr(view.store, name)[view.row] = value
+
+    return property(getter, setter)
+
+class EntityStore:
+    """Entități păstrate pe coloane NumPy, actualizate vectorizat într-un singur pas.
+
+    Fiecare rând activ are un obiect `view` (Block, PowerUp) care își
+    citește atributele prin `column_property`. Ordinea de inserare se păstrează
+    la compactare, deci iterarea dă entitățile în ordinea în care au apărut.
+    Cu un `index` (spatial.ColumnBuckets), `colliding` testează doar entitățile
+    din coloanele atinse de dreptunghiul căutat.
+    """
+    def __init__(self, capacity=64, pulse_step=0.0, index=None):
+        self.pulse_step = pulse_step  # Adăugat la `pulse` după fiecare pas (power-ups)
+        self.index = index
+        self.count = 0
+        self.views = []
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity):
+        # Coloanele sunt rânduri din două tablouri 2D (float și int), deci un snapshot e doar două copii
+        self.capacity = capacity
+        self.floats = np.zeros((len(FLOAT_COLUMNS), capacity), dtype=np.float64)
+        self.ints = np.zeros((len(INT_COLUMNS), capacity), dtype=np.int32)
+        for index, name in enumerate(FLOAT_COLUMNS):
+            setattr(self, name, self.floats[index])
+        for index, name in enumerate(INT_COLUMNS):
+            setattr(self, name, self.ints[index])
+
+    def _grow(self):
+        floats, ints, n = self.floats, self.ints, self.count
+        self._allocate(self.capacity * 2)
+        self.floats[:, :n] = floats[:, :n]
+        self.ints[:, :n] = ints[:, :n]
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(self.views)
+
+    def __getitem__(self, index):
+        return self.views[index]
+
+    def add(self, view, x, y, speed=0, vel_x=0, life=0, kind=0, size=0):
+        """Adaugă un rând nou și îl leagă de `view`"""
+        if self.count == self.capacity:
+            self._grow()
+        row = self.count
+        self.x[row] = x
+        self.y[row] = y
+        self.speed[row] = speed
+        self.vel_x[row] = vel_x
+        self.life[row] = life
+        self.pulse[row] = 0
+        self.kind[row] = kind
+        self.size[row] = size
+        self.count += 1
+
+        view.store = self
+        view.row = row
+        self.views.append(view)
+        if self.index is not None:
+            self.index.insert(view, x, size)
+        return row
+
+    def set_speed(self, speed):
+        self.speed[:self.count] = speed
+
+    def step(self):
+        """Mișcă toate entitățile cu un cadru"""
+        n = self.count
+        if not n:
+            return
+        self.x[:n] += self.vel_x[:n]
+        self.y[:n] += self.speed[:n]
+        self.life[:n] -= 1
+        if self.pulse_step:
+            self.pulse[:n] += self.pulse_step
+
+    def colliding(self, rect):
+        """Entitățile care se suprapun cu `rect`, în ordinea inserării (ca Rect.colliderect)"""
+        if self.index is not None:
+            rows = np.array(sorted(view.row for view in self.index.query(rect.x, rect.width)), dtype=np.intp)
+        else:
+            rows = np.arange(self.count)
+        if not len(rows):
+            return []
+        # pygame.Rect trunchiază coordonatele reale spre zero
+        x = np.trunc(self.x[rows])
+        y = np.trunc(self.y[rows])
+        size = self.size[rows]
+        hit = (x < rect.right) & (rect.x < x + size) & (y < rect.bottom) & (rect.y < y + size)
+        return [self.views[row] for row in rows[hit]]
+
+    def remove_where(self, mask):
+        """Elimină în bloc rândurile marcate în `mask`; returnează câte au fost eliminate"""
+        removed = int(np.count_nonzero(mask))
+        if removed:
+            self._compact(~mask)
+        return removed
+
+    def remove(self, view):
+        keep = np.ones(self.count, dtype=bool)
+        keep[view.row] = False
+        self._compact(keep)
+
+    def snapshot(self):
+        """Rândurile active, copiate ca (float-uri, int-uri): câte un tablou coloane × rânduri"""
+        n = self.count
+        return self.floats[:, :n].copy(), self.ints[:, :n].copy()
+
+    def restore(self, rows, make_view):
+        """Reface rândurile dintr-un `snapshot()`.
+
+        View-urile existente se refolosesc (legate din nou de rânduri, în
+        ordine); pentru rândurile în plus, `make_view()` creează unul nou.
+        În index se mută doar view-urile al căror rând și-a schimbat x-ul.
+        """
+        floats, ints = rows
+        n = floats.shape[1]
+        if not n and not self.count:
+            return
+        while self.capacity < n:
+            self._grow()
+        reused = min(n, self.count)
+        if self.index is not None:
+            changed = (self.x[:reused] != floats[X_ROW, :reused]) | (self.size[:reused] != ints[SIZE_ROW, :reused])
+            moved = np.flatnonzero(changed).tolist()
+        self.floats[:, :n] = floats
+        self.ints[:, :n] = ints
+        self.count = n
+
+        views = self.views
+        if self.index is not None:
+            for view in views[n:]:
+                self.index.remove(view)
+        del views[n:]
+        while len(views) < n:
+            views.append(make_view())
+        for row in range(reused, n):
+            view = views[row]
+            view.store = self
+            view.row = row
+        if self.index is not None:
+            size = self.size
+            for row in moved:
+                self.index.move(views[row], self.x[row], size[row])
+            for row in range(reused, n):
+                self.index.move(views[row], self.x[row], size[row])
+
+    def clear(self):
+        self.count = 0
+        self.views = []
+        if self.index is not None:
+            self.index.clear()
+
+    def _compact(self, keep):
+        n = self.count
+        # Rândurile dinaintea primei eliminări nu se mută
+        first_removed = int(np.argmin(keep))
+        if self.index is not None:
+            for row in np.flatnonzero(~keep):
+                self.index.remove(self.views[row])
+
+        kept = int(np.count_nonzero(keep))
+        self.floats[:, :kept] = self.floats[:, :n][:, keep]
+        self.ints[:, :kept] = self.ints[:, :n][:, keep]
+        self.count = kept
+
+        survivors = [view for view, alive in zip(self.views[first_removed:], keep[first_removed:]) if alive]
+        self.views = self.views[:first_removed] + survivors
+        for row in range(first_removed, kept):
+            self.views[row].row = row
@@ -0,0 +1,106 @@
+import json
+import sys
+import threading
+
+EVENT_CAPACITY = 4096  # Evenimente care pot aștepta scrierea; peste atât se pierd
+FLUSH_INTERVAL = 0.25  # Secunde între două scrieri ale firului de fundal
+
+# Tipurile de evenimente din joc
+BLOCK_AVOIDED = "block_avoided"
+POWERUP_COLLECTED = "powerup_collected"
+DAMAGE_TAKEN = "damage_taken"
+GAME_OVER_EVENT = "game_over"
+
+def event_log_requested(argv=None):
+    """Calea din `--events FIȘIER`, sau None (evenimentele merg la stdout)"""
+    argv = sys.argv if argv is None else argv
+    if "--events" in argv:
+        index = argv.index("--events")
+        if index + 1 < len(argv):
+            return argv[index + 1]
+    return None
+
+class EventRing:
+    """Buffer circular cu un singur producător și un singur consumator.
+
+    Producătorul (bucla jocului) scrie doar `head`, consumatorul (firul de
+    scriere) doar `tail`; fiecare atribuire e atomică sub GIL, deci nu e nevoie
+    de lock. Când bufferul e plin, evenimentul nou se pierde și se numără în
+    `dropped`, iar producătorul nu așteaptă niciodată.
+    """
+    def __init__(self, capacity=EVENT_CAPACITY):
+        self.capacity = capacity
+        self.slots = [None] * capacity
+        self.head = 0  # Câte evenimente au fost scrise
+        self.tail = 0  # Câte evenimente au fost citite
+        self.dropped = 0
+
+    def __len__(self):
+        return self.head - self.tail
+
+    def push(self, event):
+        head = self.head
+        if head - self.tail >= self.capacity:
+            self.dropped += 1
+            return False
+        self.slots[head % self.capacity] = event
+        self.head = head + 1
+        return True
+
+    def drain(self):
+        """Toate evenimentele disponibile, în ordinea scrierii"""
+        tail, head = self.tail, self.head
+        events = [self.slots[index % self.capacity] for index in range(tail, head)]
+        self.tail = head
+        return events
+
+class EventLog:
+    """Jurnal de evenimente scris în loturi, pe un fir de fundal, ca JSONL.
+
+    `emit()` doar pune evenimentul în EventRing; firul de fundal golește
+    bufferul la fiecare FLUSH_INTERVAL și scrie tot lotul cu un singur apel
+    write. Fără `path`, evenimentele merg la stdout. `close()` scrie ce a
+    rămas și oprește firul.
+    """
+    def __init__(self, path=None, capacity=EVENT_CAPACITY, flush_interval=FLUSH_INTERVAL):
+        self.ring = EventRing(capacity)
+        self.flush_interval = flush_interval
+        self.path = path
+        self.stream = open(path, "a", encoding="utf-8") if path else sys.stdout
+        self.written = 0
+        self.stopping = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="event-log", daemon=True)
+        self.thread.start()
+
+    @property
+    def dropped(self):
+        return self.ring.dropped
+
+    def emit(self, kind, frame, **fields):
+        self.ring.push((kind, frame, fields))
+
+    def _run(self):
+        while not self.stopping.wait(self.flush_interval):
+            self.flush()
+        self.flush()
+
+    def flush(self):
+        events = self.ring.drain()
+        if not events:
+            return
+        lines = [json.dumps({"event": kind, "frame": frame, **fields}) for kind, frame, fields in events]
+        self.stream.write("\n".join(lines) + "\n")
+        self.stream.flush()
+        self.written += len(events)
+
+    def close(self):
+        if self.stopping.is_set():
+            return
+        self.stopping.set()
+        self.thread.join()
+        if self.ring.dropped:
+            self.stream.write(json.dumps({"event": "dropped", "count": self.ring.dropped}) + "\n")
+        if self.path:
+            self.stream.close()
+        else:
+            self.stream.flush()
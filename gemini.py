@@ -1,13 +1,15 @@
 import pygame
-import random
 import sys
 import time
 
-# --- Setări joc ---
-SCREEN_WIDTH = 600
-SCREEN_HEIGHT = 800
-FPS = 60
-GAME_DURATION_FOR_PATTERN_CHANGE = 10  # secunde
+from dodge.gemini import (SCREEN_WIDTH, SCREEN_HEIGHT, FPS, GAME_DURATION_FOR_PATTERN_CHANGE, PLAYER_SIZE,
+                          PLAYER_SPEED, BLOCK_SIZE, BLOCK_SPEED, generate_zigzag_pattern, pattern_streams,
+                          get_current_spawn_interval)
+from dirty_rects import DirtyRectRenderer, dirty_rects_requested
+from replay import restart_session, seeded_session
+from scores import open_scores, session_record
+from startup import frame_presented, init_pygame
+from text_cache import render_text
 
 # --- Culori (paletă pixel art limitată) ---
 COLOR_BACKGROUND = (25, 25, 25)    # Gri închis aproape negru
@@ -15,30 +17,31 @@ COLOR_PLAYER = (255, 100, 100)  # Roșu deschis/rozaliu
 COLOR_BLOCK = (100, 255, 100)   # Verde deschis
 COLOR_OUTLINE = (50, 50, 50)    # Gri închis pentru contururi
 
-# --- Proprietăți jucător ---
-PLAYER_SIZE = 16
-PLAYER_SPEED = 5
-
-# --- Proprietăți blocuri ---
-BLOCK_SIZE = 32
-BLOCK_SPEED = 3
-INITIAL_BLOCK_SPAWN_INTERVAL = 700  # milisecunde (mai lent la început)
-MIN_BLOCK_SPAWN_INTERVAL = 200      # milisecunde (limita inferioară)
-DIFFICULTY_INCREASE_INTERVAL = 50   # Cu cât scade intervalul la fiecare 50 de puncte acumulate
-
 # --- Inițializare Pygame ---
-pygame.init()
+init_pygame()  # Cu --fast-start doar display și font
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Evită Blocurile!")
 clock = pygame.time.Clock()
 
+# Fundalul folosit de LayeredDirty pentru a șterge doar zonele vechi ale sprite-urilor
+background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+background.fill(COLOR_BACKGROUND)
+renderer = DirtyRectRenderer(screen, COLOR_BACKGROUND, enabled=dirty_rects_requested())
+
+# Aleatorism cu seed cunoscut, salvat cu scorul sesiunii
+rng, seed = seeded_session("gemini")
+rows = pattern_streams(rng)  # Rândurile liniei și ale grilei; rows[...].peek(n) le arată pe următoarele n
+# Sesiunile terminate se salvează în baza de scoruri (--scores FIȘIER, --no-scores)
+scores = open_scores()
+
 # --- Font pentru scor și mesaje ---
 font = pygame.font.Font(None, 48)
 
 # --- Clasa Jucător ---
-class Player(pygame.sprite.Sprite):
+class Player(pygame.sprite.DirtySprite):
     def __init__(self):
         super().__init__()
+        self.dirty = 2  # Se mișcă aproape în fiecare cadru
         self.image = pygame.Surface([PLAYER_SIZE, PLAYER_SIZE])
         self.image.fill(COLOR_PLAYER)
         pygame.draw.rect(self.image, COLOR_OUTLINE, self.image.get_rect(), 2) # Contur
@@ -67,9 +70,10 @@ class Player(pygame.sprite.Sprite):
             self.rect.bottom = SCREEN_HEIGHT
 
 # --- Clasa Bloc ---
-class Block(pygame.sprite.Sprite):
+class Block(pygame.sprite.DirtySprite):
     def __init__(self, x, y):
         super().__init__()
+        self.dirty = 2  # Cade în fiecare cadru
         self.image = pygame.Surface([BLOCK_SIZE, BLOCK_SIZE])
         self.image.fill(COLOR_BLOCK)
         pygame.draw.rect(self.image, COLOR_OUTLINE, self.image.get_rect(), 2) # Contur
@@ -83,60 +87,8 @@ class Block(pygame.sprite.Sprite):
         if self.rect.top > SCREEN_HEIGHT:
             self.kill() # Elimină blocul odată ce iese de pe ecran
 
-# --- Funcții pentru generarea pattern-urilor ---
-def generate_line_pattern(width, block_size, excluded_column=None):
-    blocks = []
-    num_blocks_x = width // block_size
-    # Asigură-te că există o coloană liberă
-    if excluded_column is None:
-        excluded_column = random.randint(0, num_blocks_x - 1)
-    for i in range(num_blocks_x):
-        if i != excluded_column:
-            blocks.append(i * block_size)
-    return blocks
-
-def generate_zigzag_pattern(width, block_size, current_step):
-    blocks = []
-    num_blocks_x = width // block_size
-    
-    # Calea liberă se mișcă de la stânga la dreapta și înapoi
-    # Folosim modulo pentru a ne asigura că `step_in_row` rămâne în limite
-    step_in_row = current_step % (num_blocks_x - 1) 
-    
-    # Direcția zigzagului (stanga-dreapta sau dreapta-stanga)
-    if (current_step // (num_blocks_x - 1)) % 2 == 0: # Merge spre dreapta
-        current_hole_col = step_in_row
-    else: # Merge spre stanga
-        current_hole_col = (num_blocks_x - 1) - step_in_row
-
-    for i in range(num_blocks_x):
-        if i != current_hole_col:
-            blocks.append(i * block_size)
-    return blocks
-
-def generate_grid_pattern(width, block_size, density=0.3): # Redu densitatea implicită
-    blocks = []
-    num_blocks_x = width // block_size
-    
-    # Alege o coloană liberă aleatorie pentru a garanta o cale
-    free_column = random.randint(0, num_blocks_x - 1)
-    
-    for i in range(num_blocks_x):
-        if i == free_column: # Această coloană rămâne liberă
-            continue
-        if random.random() < density: # Altele au șansă să apară
-            blocks.append(i * block_size)
-    return blocks
-
-# --- Funcție pentru a calcula intervalul curent de spawn ---
-def get_current_spawn_interval(current_score):
-    # Scade intervalul pe măsură ce scorul crește, dar nu sub MIN_BLOCK_SPAWN_INTERVAL
-    reduction = (current_score // 50) * DIFFICULTY_INCREASE_INTERVAL
-    new_interval = max(MIN_BLOCK_SPAWN_INTERVAL, INITIAL_BLOCK_SPAWN_INTERVAL - reduction)
-    return new_interval
-
 # --- Grupuri de sprite-uri ---
-all_sprites = pygame.sprite.Group()
+all_sprites = pygame.sprite.LayeredDirty()
 blocks = pygame.sprite.Group()
 
 # --- Inițializare jucător ---
@@ -162,6 +114,8 @@ while running:
                 # Resetare joc
                 game_over = False
                 score = 0
+                seed = restart_session(rng)
+                rows = pattern_streams(rng)  # Fără rânduri trase cu seed-ul vechi
                 start_time = time.time()
                 last_pattern_change_time = time.time()
                 current_pattern = 0
@@ -171,6 +125,7 @@ while running:
                 blocks.empty()
                 player = Player()
                 all_sprites.add(player)
+                renderer.invalidate()
 
 
     if not game_over:
@@ -187,13 +142,12 @@ while running:
         
         if now - last_block_spawn_time > current_spawn_interval:
             if current_pattern == 0: # Linie cu o gaură aleatorie
-                excluded_col = random.randint(0, (SCREEN_WIDTH // BLOCK_SIZE) - 1)
-                x_positions = generate_line_pattern(SCREEN_WIDTH, BLOCK_SIZE, excluded_col)
+                x_positions = next(rows["line"])
             elif current_pattern == 1: # Zigzag
                 # Folosim o valoare discretă pentru current_step pentru a avea variație în zigzag
                 x_positions = generate_zigzag_pattern(SCREEN_WIDTH, BLOCK_SIZE, int(current_time * 5)) # Multiplicator pentru a face zigzagul să progreseze
             else: # Grilă (apariție aleatorie, cu o cale garantată)
-                x_positions = generate_grid_pattern(SCREEN_WIDTH, BLOCK_SIZE, density=0.3) 
+                x_positions = next(rows["grid"])
 
             for x_pos in x_positions:
                 new_block = Block(x_pos, -BLOCK_SIZE)
@@ -217,23 +171,32 @@ while running:
         # Verifică coliziuni
         if pygame.sprite.spritecollideany(player, blocks):
             game_over = True
+            if scores is not None:
+                scores.record(session_record("gemini", score, (time.time() - start_time) * 1000, blocks_avoided=score,
+                                             seed=seed))
 
         # Desenare
-        screen.fill(COLOR_BACKGROUND)
-        all_sprites.draw(screen)
+        renderer.begin_frame()
+        if renderer.enabled:
+            # LayeredDirty șterge singur pozițiile vechi și întoarce zonele schimbate
+            renderer.mark_update(all_sprites.draw(screen, background))
+        else:
+            all_sprites.draw(screen)
 
         # Afișează scorul
-        score_text = font.render(f"Scor: {score}", True, COLOR_PLAYER)
-        screen.blit(score_text, (10, 10))
+        score_text = render_text(font, f"Scor: {score}", True, COLOR_PLAYER)
+        renderer.mark(screen.blit(score_text, (10, 10)))
 
-        pygame.display.flip()
+        renderer.present()
+        frame_presented()
         clock.tick(FPS)
     else:
         # Ecran Game Over
+        renderer.invalidate()
         screen.fill(COLOR_BACKGROUND)
-        game_over_text = font.render("Game Over!", True, COLOR_PLAYER)
-        score_final_text = font.render(f"Scorul tău: {score}", True, COLOR_PLAYER)
-        restart_text = font.render("Apasa 'R' pentru a juca din nou", True, COLOR_OUTLINE)
+        game_over_text = render_text(font, "Game Over!", True, COLOR_PLAYER)
+        score_final_text = render_text(font, f"Scorul tău: {score}", True, COLOR_PLAYER)
+        restart_text = render_text(font, "Apasa 'R' pentru a juca din nou", True, COLOR_OUTLINE)
 
         game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
         score_final_rect = score_final_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 10))
@@ -244,5 +207,7 @@ while running:
         screen.blit(restart_text, restart_rect)
         pygame.display.flip()
 
+if scores is not None:
+    scores.close()
 pygame.quit()
 sys.exit()
\ No newline at end of file
@@ -0,0 +1,184 @@
+import os
+import random
+import sys
+import time
+from collections import namedtuple
+
+# Fără fereastră: driverul dummy trebuie setat înainte de importul pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from dodge.claude import Simulation
+from replay import KEY_W, KEY_A, KEY_S, KEY_D, frame_dt, load_replay
+
+FPS = 60
+MAX_SESSION_FRAMES = 60 * 60 * 5  # 5 minute de joc simulat
+
+SessionResult = namedtuple("SessionResult", "score frames blocks_avoided hp game_over")
+
+def keys_from_mask(mask):
+    """Construiește starea tastelor (indexabilă cu pygame.K_*) dintr-o mască WASD"""
+    return {
+        pygame.K_w: bool(mask & KEY_W),
+        pygame.K_a: bool(mask & KEY_A),
+        pygame.K_s: bool(mask & KEY_S),
+        pygame.K_d: bool(mask & KEY_D),
+    }
+
+# Cele 16 combinații posibile, construite o singură dată
+KEY_STATES = [keys_from_mask(mask) for mask in range(16)]
+
+class VirtualClock:
+    """Ceas virtual cu pas fix; imită interfața pygame.time.Clock"""
+    def __init__(self, fps=FPS):
+        self.fps = fps
+        self.frame = 0
+        self.ticks = 0
+        self.last_dt = 0
+
+    def tick(self, framerate=0):
+        # Milisecunde întregi, ca pygame, dar fără derivă: suma după `fps` tick-uri e exact 1000
+        self.last_dt = frame_dt(self.frame, self.fps)
+        self.frame += 1
+        self.ticks += self.last_dt
+        return self.last_dt
+
+    def get_time(self):
+        return self.last_dt
+
+    def get_ticks(self):
+        return self.ticks
+
+    def seek(self, frame):
+        """Poziționează ceasul ca și cum ar fi trecut deja `frame` tick-uri"""
+        self.frame = frame
+        self.ticks = frame * 1000 // self.fps
+        self.last_dt = frame_dt(frame - 1, self.fps) if frame else 0
+
+class IdleInput:
+    """Sursă de intrare fără nicio tastă apăsată"""
+    def __call__(self, frame, sim):
+        return KEY_STATES[0]
+
+class ScriptedInput:
+    """Redă o secvență de măști WASD, câte una pe cadru; după final repetă ultima"""
+    def __init__(self, masks):
+        self.masks = list(masks) or [0]
+
+    def __call__(self, frame, sim):
+        index = min(frame, len(self.masks) - 1)
+        return KEY_STATES[self.masks[index]]
+
+class RandomWalkInput:
+    """Alege o combinație aleatorie de taste și o ține apăsată câteva cadre"""
+    def __init__(self, seed=None, hold_frames=15):
+        self.rng = random.Random(seed)
+        self.hold_frames = hold_frames
+        self.mask = 0
+
+    def __call__(self, frame, sim):
+        if frame % self.hold_frames == 0:
+            self.mask = self.rng.randrange(16)
+        return KEY_STATES[self.mask]
+
+class ReplayInput:
+    """Redă tastele dintr-un replay înregistrat (vezi replay.py)"""
+    def __init__(self, replay):
+        self.keys = replay.keys
+
+    def __call__(self, frame, sim):
+        return KEY_STATES[self.keys[frame]] if frame < len(self.keys) else KEY_STATES[0]
+
+class HeadlessRunner:
+    """Rulează sesiuni complete ale jocului din claude.py, cât de repede permite CPU-ul"""
+    def __init__(self, input_source=None, fps=FPS, max_frames=MAX_SESSION_FRAMES):
+        self.input_source = input_source if input_source is not None else IdleInput()
+        self.fps = fps
+        self.max_frames = max_frames
+        self.sim = Simulation()
+
+    def run_session(self, seed=None):
+        clock = VirtualClock(self.fps)
+        sim = self.sim
+        sim.reset_game(seed)
+
+        for frame in range(self.max_frames):
+            keys = self.input_source(frame, sim)
+            sim.step(keys, clock.tick())
+            if sim.game_over:
+                break
+
+        return SessionResult(sim.score, sim.frame_count, sim.blocks_avoided,
+                             sim.player.hp, sim.game_over)
+
+def run_sessions(count, input_factory=RandomWalkInput, seed=0, max_frames=MAX_SESSION_FRAMES):
+    """Rulează `count` sesiuni deterministe; sesiunea i folosește seed + i"""
+    results = []
+    for i in range(count):
+        runner = HeadlessRunner(input_factory(seed + i), max_frames=max_frames)
+        results.append(runner.run_session(seed + i))
+    return results
+
+def check_replay_game(replay):
+    if replay.game != "claude":
+        raise ValueError(f"Replay-ul headless e disponibil doar pentru claude.py, nu pentru {replay.game}")
+
+def replay_session(path):
+    """Rulează din nou, fără fereastră și fără limită de viteză, o sesiune înregistrată"""
+    with load_replay(path) as replay:
+        check_replay_game(replay)
+        runner = HeadlessRunner(ReplayInput(replay), fps=replay.fps, max_frames=len(replay.keys))
+        return runner.run_session(replay.seed)
+
+def seek_replay(replay, frame, sim=None):
+    """Simularea unui replay deschis, adusă exact la începutul cadrului `frame`.
+
+    Pornește din cel mai apropiat keyframe anterior (sau de la seed, dacă nu
+    există) și simulează doar cadrele rămase până la `frame`.
+    """
+    check_replay_game(replay)
+    frame = max(0, min(frame, len(replay.keys)))
+    sim = sim if sim is not None else Simulation()
+    start, state = replay.keyframe_before(frame)
+    if state is None:
+        sim.reset_game(replay.seed)
+    else:
+        sim.load_state_dict(state)
+    clock = VirtualClock(replay.fps)
+    clock.seek(start)
+    input_source = ReplayInput(replay)
+    for current in range(start, frame):
+        sim.step(input_source(current, sim), clock.tick())
+    return sim
+
+def main():
+    if sys.argv[1:2] == ["--replay"]:
+        start = time.perf_counter()
+        if "--at" in sys.argv:
+            # Salt direct la secunda cerută, pornind de la keyframe-ul anterior
+            seconds = float(sys.argv[sys.argv.index("--at") + 1])
+            with load_replay(sys.argv[2]) as replay:
+                sim = seek_replay(replay, int(seconds * replay.fps))
+            elapsed = time.perf_counter() - start
+            print(f"Replay la {seconds:.0f}s (cadrul {sim.frame_count}) în {elapsed:.3f}s: scor {sim.score}, "
+                  f"viteză {sim.current_speed}, blocuri {len(sim.blocks)}, HP {sim.player.hp}")
+            return
+        result = replay_session(sys.argv[2])
+        elapsed = time.perf_counter() - start
+        print(f"Replay: {result.frames} cadre în {elapsed:.2f}s, scor {result.score}, "
+              f"blocuri evitate {result.blocks_avoided}, HP {result.hp}")
+        return
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    start = time.perf_counter()
+    results = run_sessions(count)
+    elapsed = time.perf_counter() - start
+
+    frames = sum(r.frames for r in results)
+    average_score = sum(r.score for r in results) / len(results)
+    print(f"{count} sesiuni, {frames} cadre în {elapsed:.2f}s "
+          f"({count / elapsed:.1f} sesiuni/s, {frames / elapsed:.0f} cadre/s)")
+    print(f"Scor mediu: {average_score:.1f}")
+
+if __name__ == "__main__":
+    main()
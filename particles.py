@@ -0,0 +1,168 @@
+import random
+
+import numpy as np
+import pygame
+
+FADE_LEVELS = 30  # Nuanțe pre-randate pentru stingerea unei particule
+COLORKEY = (255, 0, 255)
+
+# Coloanele pool-ului
+FLOAT_COLUMNS = ("x", "y", "vel_x", "vel_y", "gravity", "life", "max_life")
+INT_COLUMNS = ("size", "color")
+
+class ParticleEmitter:
+    """Configurația unui efect: câte particule, ce viteze, cât trăiesc și cum arată"""
+    def __init__(self, count, speed_x=(-8, 8), speed_y=(-8, 8), life=30, sizes=(2, 4),
+                 color=(255, 255, 255), gravity=0.3):
+        self.count = count
+        self.speed_x = speed_x  # Interval inclusiv, ca random.randint
+        self.speed_y = speed_y
+        self.life = life
+        self.sizes = sizes
+        self.color = color
+        self.gravity = gravity
+
+# Efecte predefinite
+IMPACT = ParticleEmitter(12)
+EXPLOSION = ParticleEmitter(60, speed_x=(-12, 12), speed_y=(-14, 6), life=45, sizes=(2, 5),
+                           color=(255, 180, 80))
+PICKUP = ParticleEmitter(16, speed_x=(-4, 4), speed_y=(-6, 0), life=24, sizes=(1, 3),
+                         color=(255, 215, 0), gravity=0.15)
+TRAIL = ParticleEmitter(1, speed_x=(-1, 1), speed_y=(1, 2), life=12, sizes=(1, 2),
+                        color=(128, 128, 128), gravity=0.0)
+
+class ParticlePool:
+    """Pool de particule cu capacitate fixă, pe coloane NumPy.
+
+    Rândurile particulelor moarte se refolosesc, deci după inițializare nu se
+    mai alocă obiecte Python pe particulă. Când pool-ul e plin, particulele noi
+    sunt ignorate și numărate în `dropped`. Desenarea folosește cercuri
+    pre-randate pentru fiecare culoare, mărime și nivel de stingere, trimise
+    ecranului într-un singur apel `blits`.
+    """
+    def __init__(self, capacity=1024, rng=None):
+        self.capacity = capacity
+        self.count = 0
+        self.dropped = 0
+        # Generator propriu: efectele vizuale nu consumă din random-ul jocului
+        self.rng = rng if rng is not None else random.Random()
+        # Coloanele sunt rânduri din două tablouri 2D, ca în EntityStore
+        self.floats = np.zeros((len(FLOAT_COLUMNS), capacity), dtype=np.float64)
+        self.ints = np.zeros((len(INT_COLUMNS), capacity), dtype=np.int32)
+        for index, name in enumerate(FLOAT_COLUMNS):
+            setattr(self, name, self.floats[index])
+        for index, name in enumerate(INT_COLUMNS):
+            setattr(self, name, self.ints[index])
+
+        self.colors = []  # Indexul culorii e păstrat în coloana `color`
+        self.sprites = {}
+
+    def __len__(self):
+        return self.count
+
+    def _color_index(self, color):
+        if color not in self.colors:
+            self.colors.append(color)
+        return self.colors.index(color)
+
+    def emit(self, emitter, x, y):
+        """Lansează particulele unui efect din punctul (x, y)"""
+        color = self._color_index(emitter.color)
+        room = self.capacity - self.count
+        count = min(emitter.count, room)
+        self.dropped += emitter.count - count
+
+        rng = self.rng
+        for row in range(self.count, self.count + count):
+            self.x[row] = x
+            self.y[row] = y
+            self.vel_x[row] = rng.randint(*emitter.speed_x)
+            self.vel_y[row] = rng.randint(*emitter.speed_y)
+            self.size[row] = rng.randint(*emitter.sizes)
+        end = self.count + count
+        self.gravity[self.count:end] = emitter.gravity
+        self.life[self.count:end] = emitter.life
+        self.max_life[self.count:end] = emitter.life
+        self.color[self.count:end] = color
+        self.count = end
+
+    def update(self):
+        n = self.count
+        if not n:
+            return
+        self.x[:n] += self.vel_x[:n]
+        self.y[:n] += self.vel_y[:n]
+        self.vel_y[:n] += self.gravity[:n]
+        self.life[:n] -= 1
+
+        alive = self.life[:n] > 0
+        kept = int(np.count_nonzero(alive))
+        if kept < n:
+            self.floats[:, :kept] = self.floats[:, :n][:, alive]
+            self.ints[:, :kept] = self.ints[:, :n][:, alive]
+            self.count = kept
+
+    def snapshot(self):
+        """Particulele active, ca (float-uri, int-uri); culorile rămân indexuri în `colors`.
+
+        Generatorul propriu nu e inclus: particulele sunt doar vizuale, iar
+        getstate() ar costa mai mult decât restul snapshot-ului.
+        """
+        n = self.count
+        return self.floats[:, :n].copy(), self.ints[:, :n].copy()
+
+    def restore(self, snapshot):
+        floats, ints = snapshot
+        n = floats.shape[1]
+        self.floats[:, :n] = floats
+        self.ints[:, :n] = ints
+        self.count = n
+
+    def clear(self):
+        self.count = 0
+
+    def sprite(self, color, size, level):
+        """Cercul pre-randat pentru o culoare, o rază și un nivel de stingere"""
+        key = (color, size, level)
+        surface = self.sprites.get(key)
+        if surface is None:
+            r, g, b = self.colors[color]
+            fade = level / FADE_LEVELS
+            surface = pygame.Surface((size * 2, size * 2))
+            surface.fill(COLORKEY)
+            pygame.draw.circle(surface, (int(r * fade), int(g * fade), int(b * fade)), (size, size), size)
+            surface.set_colorkey(COLORKEY, pygame.RLEACCEL)
+            self.sprites[key] = surface
+        return surface
+
+    def prebake(self, emitter):
+        """Randează dinainte toate sprite-urile unui efect (de ex. la pornire)"""
+        color = self._color_index(emitter.color)
+        for size in range(emitter.sizes[0], emitter.sizes[1] + 1):
+            for level in range(1, FADE_LEVELS + 1):
+                self.sprite(color, size, level)
+
+    def draw(self, screen, doreturn=False, alpha=1.0):
+        """Desenează toate particulele; cu `doreturn` returnează zonele atinse.
+
+        `alpha` interpolează între ultimele două update-uri: poziția anterioară
+        se obține din viteze, deci nu trebuie păstrată separat.
+        """
+        n = self.count
+        if not n:
+            return []
+        levels = np.ceil(self.life[:n] / self.max_life[:n] * FADE_LEVELS)
+        levels = np.clip(levels, 1, FADE_LEVELS).astype(np.int32)
+        sizes = self.size[:n]
+        x, y = self.x[:n], self.y[:n]
+        if alpha < 1.0:
+            lag = 1.0 - alpha
+            x = x - self.vel_x[:n] * lag
+            y = y - (self.vel_y[:n] - self.gravity[:n]) * lag
+        xs = x.astype(np.int32) - sizes
+        ys = y.astype(np.int32) - sizes
+        sprite = self.sprite
+        return screen.blits([(sprite(color, size, level), (x, y))
+                             for color, size, level, x, y in zip(self.color[:n].tolist(), sizes.tolist(),
+                                                                 levels.tolist(), xs.tolist(), ys.tolist())],
+                            doreturn)
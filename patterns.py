@@ -0,0 +1,129 @@
+from collections import deque
+from functools import cached_property, lru_cache
+from itertools import islice
+
+class RowStream:
+    """Generator leneș de rânduri (măști de coloane sau coloane libere), cu lookahead.
+
+    `next(stream)` consumă rândul următor, iar `peek(n)` întoarce următoarele
+    n rânduri fără să le consume (pentru AI sau previzualizare). Rândurile se
+    generează doar când sunt cerute; cele văzute prin `peek` se păstrează
+    până sunt consumate, deci ordinea rămâne aceeași.
+    """
+    def __init__(self, rows):
+        self.rows = iter(rows)
+        self.buffer = deque()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.buffer:
+            return self.buffer.popleft()
+        return next(self.rows)
+
+    def peek(self, count=1):
+        missing = count - len(self.buffer)
+        if missing > 0:
+            self.buffer.extend(islice(self.rows, missing))
+        return list(islice(self.buffer, count))
+
+class PatternLibrary:
+    """Rândurile pattern-urilor de spawn, pre-calculate pentru o lățime de ecran.
+
+    Un rând e o mască de biți: bitul i înseamnă un bloc în coloana i (la
+    x = i * block_size). Tabelele fiecărui pattern se construiesc o singură
+    dată, la prima folosire, iar `positions(mask)` întoarce un tuplu de
+    coordonate x memorat pentru fiecare mască, deci un spawn nu mai
+    construiește liste. Tuplurile sunt partajate și nu trebuie modificate.
+    Rândurile aleatoare (`random_positions`) se construiesc la fiecare spawn.
+    """
+    def __init__(self, width, block_size):
+        self.width = width
+        self.block_size = block_size
+        self.columns = width // block_size
+        self.full_mask = (1 << self.columns) - 1
+        self.column_xs = tuple(column * block_size for column in range(self.columns))
+        self._positions = {}
+        self._gates = {}
+
+    def positions(self, mask, offset=0):
+        """Coordonatele x ale blocurilor din `mask`, deplasate cu `offset` pixeli.
+
+        Cu offset, coordonatele care ies din ecran se reiau de la stânga
+        (ca zigzag-ul din perplexity.py).
+        """
+        key = (mask, offset)
+        xs = self._positions.get(key)
+        if xs is None:
+            wrap = self.width - self.block_size + 1
+            xs = tuple((column * self.block_size + offset) % wrap if offset else column * self.block_size
+                       for column in range(self.columns) if (mask >> column) & 1)
+            self._positions[key] = xs
+        return xs
+
+    @cached_property
+    def single_gaps(self):
+        """Linie completă cu o singură coloană liberă, indexată după coloana liberă"""
+        return tuple(self.full_mask & ~(1 << column) for column in range(self.columns))
+
+    def gates(self, gate_width):
+        """Linie completă cu o poartă de `gate_width` coloane, indexată după prima coloană a porții"""
+        rows = self._gates.get(gate_width)
+        if rows is None:
+            gate = (1 << gate_width) - 1
+            rows = tuple(self.full_mask & ~(gate << start) for start in range(self.columns - gate_width + 1))
+            self._gates[gate_width] = rows
+        return rows
+
+    @cached_property
+    def alternating(self):
+        """Blocuri din două în două coloane: [0] pe coloanele pare, [1] pe cele impare"""
+        even = sum(1 << column for column in range(0, self.columns, 2))
+        return even, self.full_mask & ~even
+
+    @cached_property
+    def zigzag(self):
+        """Linie cu o gaură care merge de la stânga la dreapta și înapoi, pentru fiecare pas din perioadă"""
+        span = self.columns - 1
+        rows = []
+        for step in range(2 * span):
+            hole = step % span if (step // span) % 2 == 0 else span - step % span
+            rows.append(self.full_mask & ~(1 << hole))
+        return tuple(rows)
+
+    def zigzag_row(self, step):
+        return self.zigzag[step % len(self.zigzag)]
+
+    def random_positions(self, rng, density, stride=1, exclude=None):
+        """Fiecare a `stride`-a coloană e ocupată cu probabilitatea `density`; `exclude` rămâne liberă.
+
+        Rândurile aleatoare nu trec prin măști: ar umple cache-ul `positions`
+        cu combinații care nu se mai repetă, așa că se întorc direct
+        coordonatele x, cu o singură extragere pentru fiecare coloană.
+        """
+        draw = rng.random
+        excluded_x = None if exclude is None else exclude * self.block_size
+        xs = self.column_xs if stride == 1 else self.column_xs[::stride]
+        return [x for x in xs if x != excluded_x and draw() < density]
+
+    def stream(self, next_row):
+        """RowStream infinit din funcția `next_row()`, apelată leneș pentru fiecare rând"""
+        def rows():
+            while True:
+                yield next_row()
+        return RowStream(rows())
+
+    def gap_stream(self, rng):
+        """Coloanele libere ale liniilor cu o singură gaură (vezi `single_gaps`), extrase leneș.
+
+        Fiecare coloană e un rng.randint(0, columns - 1), ca în perplexity.py,
+        deci cu același seed jocul vede aceleași goluri. `peek` doar mută
+        extragerile mai devreme; ordinea lor nu se schimbă.
+        """
+        return self.stream(lambda: rng.randint(0, self.columns - 1))
+
+@lru_cache(maxsize=None)
+def pattern_library(width, block_size):
+    """Biblioteca comună pentru o lățime de ecran și o mărime de bloc (creată o singură dată)"""
+    return PatternLibrary(width, block_size)
@@ -0,0 +1,131 @@
+import csv
+import sys
+import time
+
+import numpy as np
+import pygame
+
+PROFILE_PHASES = ("events", "update", "draw", "present")
+PROFILE_WINDOW = 240  # Ultimele 4 secunde la 60 FPS
+FRAME_BUDGET_MS = 1000 / 60
+TEXT_REFRESH_FRAMES = 15  # Textul overlay-ului se rerandează de 4 ori pe secundă
+
+PANEL_WIDTH = 300
+PANEL_HEIGHT = 170
+GRAPH_HEIGHT = 50
+GRAPH_MAX_MS = FRAME_BUDGET_MS * 2
+
+def profile_csv_requested(argv=None):
+    """Calea din `--profile-csv FIȘIER`, sau None"""
+    argv = sys.argv if argv is None else argv
+    if "--profile-csv" in argv:
+        index = argv.index("--profile-csv")
+        if index + 1 < len(argv):
+            return argv[index + 1]
+    return None
+
+class FrameProfiler:
+    """Timpii fazelor fiecărui cadru, pe o fereastră circulară, plus un overlay.
+
+    Bucla apelează `begin_frame()`, apoi `mark(faza)` după fiecare fază din
+    PROFILE_PHASES și `end_frame(...)` cu numărul de entități. Percentilele se
+    calculează pe ultimele `window` cadre. Cu `csv_path`, toate cadrele se
+    păstrează și se scriu la `save_csv()`.
+    """
+    def __init__(self, window=PROFILE_WINDOW, csv_path=None):
+        self.window = window
+        self.csv_path = csv_path
+        # Coloanele: fazele, apoi durata totală a cadrului (ms)
+        self.samples = np.zeros((window, len(PROFILE_PHASES) + 1))
+        self.current = [0.0] * len(PROFILE_PHASES)
+        self.frames = 0
+        self.history = [] if csv_path else None
+        self.counts = (0, 0, 0)
+        self.visible = False
+        self.frame_start = 0.0
+        self.phase_start = 0.0
+
+        self.panel = pygame.Surface((PANEL_WIDTH, PANEL_HEIGHT))
+        self.panel.set_alpha(200)
+        self.text_lines = []
+
+    def toggle(self):
+        self.visible = not self.visible
+
+    def begin_frame(self):
+        self.frame_start = self.phase_start = time.perf_counter()
+        for phase in range(len(self.current)):
+            self.current[phase] = 0.0
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.current[PROFILE_PHASES.index(phase)] += (now - self.phase_start) * 1000
+        self.phase_start = now
+
+    def end_frame(self, blocks=0, powerups=0, particles=0):
+        total = (time.perf_counter() - self.frame_start) * 1000
+        row = self.samples[self.frames % self.window]
+        row[:-1] = self.current
+        row[-1] = total
+        self.frames += 1
+        self.counts = (blocks, powerups, particles)
+        if self.history is not None:
+            self.history.append((self.frames, *self.current, total, blocks, powerups, particles))
+
+    def recent(self):
+        """Rândurile din fereastră, de la cel mai vechi la cel mai nou cadru"""
+        if self.frames < self.window:
+            return self.samples[:self.frames]
+        start = self.frames % self.window
+        return np.concatenate((self.samples[start:], self.samples[:start]))
+
+    def percentiles(self):
+        """(p50, p95, p99) ale duratei cadrelor din fereastră, în ms"""
+        if not self.frames:
+            return 0.0, 0.0, 0.0
+        return tuple(np.percentile(self.recent()[:, -1], (50, 95, 99)).tolist())
+
+    def phase_means(self):
+        if not self.frames:
+            return [0.0] * len(PROFILE_PHASES)
+        return self.recent()[:, :-1].mean(axis=0).tolist()
+
+    def draw(self, screen, font, position):
+        """Desenează overlay-ul; returnează dreptunghiul acoperit"""
+        if self.frames % TEXT_REFRESH_FRAMES == 1 or not self.text_lines:
+            p50, p95, p99 = self.percentiles()
+            means = self.phase_means()
+            blocks, powerups, particles = self.counts
+            lines = [f"cadru p50 {p50:.1f}  p95 {p95:.1f}  p99 {p99:.1f} ms"]
+            lines += [f"{phase:<8} {mean:6.2f} ms" for phase, mean in zip(PROFILE_PHASES, means)]
+            lines.append(f"blocuri {blocks}  power-ups {powerups}  particule {particles}")
+            # font.render direct: valorile se schimbă mereu și ar goli cache-ul de text al HUD-ului
+            self.text_lines = [font.render(line, True, (255, 255, 255)) for line in lines]
+
+        panel = self.panel
+        panel.fill((0, 0, 0))
+        y = 4
+        for text in self.text_lines:
+            panel.blit(text, (6, y))
+            y += text.get_height()
+
+        # Graficul duratelor, cu linia bugetului de 16.6 ms
+        top = PANEL_HEIGHT - GRAPH_HEIGHT - 4
+        totals = self.recent()[:, -1]
+        scale = GRAPH_HEIGHT / GRAPH_MAX_MS
+        budget_y = top + GRAPH_HEIGHT - int(FRAME_BUDGET_MS * scale)
+        for x, total in enumerate(totals[-(PANEL_WIDTH - 12):].tolist(), start=6):
+            height = min(GRAPH_HEIGHT, int(total * scale))
+            color = (255, 80, 80) if total > FRAME_BUDGET_MS else (80, 220, 80)
+            pygame.draw.line(panel, color, (x, top + GRAPH_HEIGHT), (x, top + GRAPH_HEIGHT - height))
+        pygame.draw.line(panel, (255, 255, 0), (6, budget_y), (PANEL_WIDTH - 6, budget_y))
+
+        return screen.blit(panel, position)
+
+    def save_csv(self, path=None):
+        path = path or self.csv_path
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(("frame", *(f"{phase}_ms" for phase in PROFILE_PHASES), "total_ms",
+                             "blocks", "powerups", "particles"))
+            writer.writerows(self.history)
@@ -0,0 +1,257 @@
+import json
+import mmap
+import os
+import random
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_right
+from collections import namedtuple
+
+import pygame
+
+# Tastele WASD codificate pe 4 biți (w=1, a=2, s=4, d=8)
+KEY_W = 1
+KEY_A = 2
+KEY_S = 4
+KEY_D = 8
+
+REPLAY_MAGIC = b"EVRP"
+REPLAY_VERSION = 2
+# magic, versiune, seed, fps, număr de cadre, interval și număr de keyframe-uri;
+# urmează numele jocului, tastele, tabela de keyframe-uri și keyframe-urile
+HEADER = struct.Struct("<4sBQHIII")
+HEADER_V1 = struct.Struct("<4sBQHI")
+# cadru, offset în fișier, lungime
+KEYFRAME_ENTRY = struct.Struct("<IQI")
+KEYFRAME_INTERVAL = 60 * 30  # Un keyframe la 30 s de joc (cât o treaptă de viteză)
+SEED_BITS = 63
+
+Replay = namedtuple("Replay", "game seed fps keys keyframe_interval keyframes")
+
+def mask_from_keys(keys):
+    """Masca WASD pentru o stare de taste indexabilă cu pygame.K_*"""
+    return ((KEY_W if keys[pygame.K_w] else 0) | (KEY_A if keys[pygame.K_a] else 0) |
+            (KEY_S if keys[pygame.K_s] else 0) | (KEY_D if keys[pygame.K_d] else 0))
+
+def frame_dt(frame, fps):
+    """Durata în milisecunde a cadrului `frame` la pas fix (suma pe o secundă e exact 1000)"""
+    return (frame + 1) * 1000 // fps - frame * 1000 // fps
+
+def new_seed():
+    return random.SystemRandom().getrandbits(SEED_BITS)
+
+def encode_keyframe(state):
+    return zlib.compress(json.dumps(state, separators=(",", ":")).encode("utf-8"))
+
+def decode_keyframe(data):
+    return json.loads(zlib.decompress(data))
+
+class KeyLog:
+    """Măștile WASD ale unei sesiuni, două cadre pe octet (cadrul par în biții de jos).
+
+    La citire `data` poate fi un memoryview peste fișierul mapat în memorie,
+    caz în care jurnalul e doar pentru citire.
+    """
+    def __init__(self, data=b"", frames=0):
+        self.data = data if isinstance(data, memoryview) else array("B", data)
+        self.frames = frames
+
+    def __len__(self):
+        return self.frames
+
+    def append(self, mask):
+        if self.frames % 2 == 0:
+            self.data.append(mask & 0x0F)
+        else:
+            self.data[-1] |= (mask & 0x0F) << 4
+        self.frames += 1
+
+    def __getitem__(self, frame):
+        if not 0 <= frame < self.frames:
+            raise IndexError(frame)
+        return (self.data[frame >> 1] >> ((frame & 1) * 4)) & 0x0F
+
+    def __iter__(self):
+        return (self[frame] for frame in range(self.frames))
+
+    def tobytes(self):
+        return self.data.tobytes()
+
+def save_replay(path, replay):
+    """Scrie replay-ul; `replay.keyframes` e o listă de (cadru, keyframe codificat)"""
+    name = replay.game.encode("utf-8")
+    keys = replay.keys.tobytes()
+    offset = HEADER.size + 1 + len(name) + len(keys) + KEYFRAME_ENTRY.size * len(replay.keyframes)
+    table = []
+    for frame, blob in replay.keyframes:
+        table.append(KEYFRAME_ENTRY.pack(frame, offset, len(blob)))
+        offset += len(blob)
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, replay.seed, replay.fps, len(replay.keys),
+                               replay.keyframe_interval, len(replay.keyframes)))
+        file.write(bytes([len(name)]) + name)
+        file.write(keys)
+        file.write(b"".join(table))
+        for _, blob in replay.keyframes:
+            file.write(blob)
+
+class ReplayFile:
+    """Un replay deschis prin mmap: tastele și keyframe-urile se citesc la cerere.
+
+    Doar antetul și tabela de keyframe-uri sunt citite la deschidere; un
+    keyframe se decodează abia când e cerut, deci saltul la minutul 40 al unei
+    sesiuni lungi costă cât decodarea unui keyframe plus cel mult
+    `keyframe_interval` cadre de simulare (vezi headless.seek_replay).
+    """
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.mmap)
+        try:
+            self._parse(path)
+        except Exception:
+            self.close()
+            raise
+
+    def _parse(self, path):
+        data = self.view
+        if len(data) < HEADER_V1.size or bytes(data[:4]) != REPLAY_MAGIC:
+            raise ValueError(f"{path} nu este un fișier de replay")
+        version = data[4]
+        if version == 1:
+            _, _, self.seed, self.fps, frames = HEADER_V1.unpack_from(data)
+            self.keyframe_interval, keyframe_count = 0, 0
+            offset = HEADER_V1.size
+        elif version == REPLAY_VERSION:
+            (_, _, self.seed, self.fps, frames,
+             self.keyframe_interval, keyframe_count) = HEADER.unpack_from(data)
+            offset = HEADER.size
+        else:
+            raise ValueError(f"Versiune de replay necunoscută: {version}")
+
+        name_length = data[offset]
+        self.game = bytes(data[offset + 1:offset + 1 + name_length]).decode("utf-8")
+        offset += 1 + name_length
+        key_bytes = (frames + 1) // 2
+        if offset + key_bytes > len(data):
+            raise ValueError(f"{path} este trunchiat")
+        self.keys = KeyLog(data[offset:offset + key_bytes], frames)
+        offset += key_bytes
+
+        self.keyframe_table = [KEYFRAME_ENTRY.unpack_from(data, offset + i * KEYFRAME_ENTRY.size)
+                               for i in range(keyframe_count)]
+        self.keyframe_frames = [frame for frame, _, _ in self.keyframe_table]
+
+    def __len__(self):
+        return len(self.keys)
+
+    def keyframe(self, index):
+        """(cadru, stare) pentru keyframe-ul `index`, decodat din fișierul mapat"""
+        frame, offset, length = self.keyframe_table[index]
+        return frame, decode_keyframe(self.view[offset:offset + length])
+
+    def keyframe_before(self, frame):
+        """Cel mai apropiat keyframe la sau înainte de `frame`; (0, None) dacă nu există"""
+        index = bisect_right(self.keyframe_frames, frame) - 1
+        if index < 0:
+            return 0, None
+        return self.keyframe(index)
+
+    def close(self):
+        if self.mmap is None:
+            return
+        if hasattr(self, "keys"):
+            self.keys.data.release()
+        self.view.release()
+        self.mmap.close()
+        self.mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def load_replay(path):
+    return ReplayFile(path)
+
+class InputRecorder:
+    """Înregistrează seed-ul și tastele WASD ale fiecărui cadru dintr-o sesiune.
+
+    `start(seed)` începe o sesiune nouă (seed-ul trebuie folosit și pentru
+    generatorul jocului), `record(keys)` se apelează o dată pe cadru de
+    simulare, iar `save()` scrie fișierul binar al sesiunii curente: prima
+    la `path`, următoarele (restart după Game Over) la `nume.N.ext`.
+    """
+    def __init__(self, game, path, fps=60, keyframe_interval=KEYFRAME_INTERVAL):
+        self.game = game
+        self.path = path
+        self.fps = fps
+        self.keyframe_interval = keyframe_interval
+        self.seed = 0
+        self.keys = KeyLog()
+        self.keyframes = []
+        self.sessions = 0
+
+    def start(self, seed):
+        self.seed = seed
+        self.keys = KeyLog()
+        self.keyframes = []
+        self.sessions += 1
+
+    def session_path(self):
+        if self.sessions <= 1:
+            return self.path
+        root, extension = os.path.splitext(self.path)
+        return f"{root}.{self.sessions}{extension}"
+
+    @property
+    def frames(self):
+        return len(self.keys)
+
+    def record(self, keys):
+        self.keys.append(mask_from_keys(keys))
+
+    def wants_keyframe(self):
+        """Dacă înainte de cadrul următor trebuie salvat un keyframe"""
+        frames = self.frames
+        return self.keyframe_interval > 0 and frames > 0 and frames % self.keyframe_interval == 0
+
+    def add_keyframe(self, state):
+        """Starea completă a jocului după `frames` cadre (vezi Simulation.state_dict)"""
+        self.keyframes.append((self.frames, encode_keyframe(state)))
+
+    def replay(self):
+        return Replay(self.game, self.seed, self.fps, self.keys, self.keyframe_interval, self.keyframes)
+
+    def save(self):
+        save_replay(self.session_path(), self.replay())
+
+def recorder_requested(argv=None):
+    """Calea din `--record FIȘIER`, sau None dacă înregistrarea nu e cerută"""
+    argv = sys.argv if argv is None else argv
+    if "--record" in argv:
+        index = argv.index("--record")
+        if index + 1 < len(argv):
+            return argv[index + 1]
+    return None
+
+def seeded_session(game, argv=None):
+    """Pentru scripturile cu buclă la nivel de modul: (rng cu seed nou, seed).
+
+    Buclele lor avansează după ceasul real, deci o sesiune nu poate fi
+    rejucată; `--record` e acceptat doar de claude.py.
+    """
+    if recorder_requested(argv) is not None:
+        print(f"{game}: --record e disponibil doar pentru claude.py, sesiunea nu se înregistrează",
+              file=sys.stderr)
+    seed = new_seed()
+    return random.Random(seed), seed
+
+def restart_session(rng):
+    """Seed nou pentru `rng` la o sesiune nouă (restart după Game Over); îl întoarce"""
+    seed = new_seed()
+    rng.seed(seed)
+    return seed
@@ -0,0 +1,98 @@
+from collections import deque
+
+class AliasTable:
+    """Eșantionare dintr-o distribuție discretă în O(1), cu metoda alias (Vose).
+
+    Tabelul se construiește o dată în O(n) din ponderi (nu trebuie
+    normalizate); fiecare `sample(rng)` consumă un singur rng.random().
+    Bin-urile cu pondere 0 nu sunt alese niciodată.
+    """
+    def __init__(self, weights):
+        n = len(weights)
+        total = sum(weights)
+        self.size = n
+        self.probability = [1.0] * n
+        self.alias = list(range(n))
+        if n == 0 or total <= 0:
+            return
+
+        scaled = [weight * n / total for weight in weights]
+        small = [index for index, value in enumerate(scaled) if value < 1.0]
+        large = [index for index, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probability[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Ce rămâne are probabilitatea 1 (până la erorile de rotunjire)
+        for index in small + large:
+            self.probability[index] = 1.0
+            self.alias[index] = index
+
+    def sample(self, rng):
+        position = rng.random() * self.size
+        index = int(position)
+        if position - index < self.probability[index]:
+            return index
+        return self.alias[index]
+
+class SlidingHistogram:
+    """Ultimele `window` valori și histograma lor pe `bins` bin-uri, actualizată incremental.
+
+    `push` adaugă o valoare și o elimină pe cea mai veche peste fereastră
+    (deque, deci O(1)), ajustând doar numărătorile bin-urilor atinse.
+    `alias_table()` se reconstruiește doar când numărătorile s-au schimbat
+    de la ultima cerere. Iterarea întoarce valorile, de la cea mai veche.
+    """
+    def __init__(self, bins, window, bin_of):
+        self.bins = bins
+        self.window = window
+        self.bin_of = bin_of
+        self.values = deque()
+        self.counts = [0] * bins
+        self.version = 0  # Crește la fiecare schimbare a numărătorilor
+        self._table = None
+        self._table_version = -1
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def push(self, value):
+        values = self.values
+        added = self.bin_of(value)
+        values.append(value)
+        if len(values) > self.window:
+            removed = self.bin_of(values.popleft())
+            if removed == added:
+                return
+            self.counts[removed] -= 1
+        self.counts[added] += 1
+        self.version += 1
+
+    def extend(self, values):
+        for value in values:
+            self.push(value)
+
+    def clear(self):
+        self.values.clear()
+        self.counts = [0] * self.bins
+        self.version += 1
+
+    def snapshot(self):
+        return tuple(self.values), tuple(self.counts)
+
+    def restore(self, snapshot):
+        values, counts = snapshot
+        self.values = deque(values)
+        self.counts = list(counts)
+        self.version += 1
+
+    def alias_table(self):
+        if self._table_version != self.version:
+            self._table = AliasTable(self.counts)
+            self._table_version = self.version
+        return self._table
@@ -0,0 +1,188 @@
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import namedtuple
+
+SCORES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scores.db")
+FLUSH_INTERVAL = 1.0  # Secunde între două loturi scrise de firul de fundal
+LEADERBOARD_SIZE = 5
+
+# O sesiune terminată; `played_at` e time.time() la final, `day` data locală (AAAA-LL-ZZ)
+SessionRecord = namedtuple("SessionRecord", "variant seed score duration_ms blocks_avoided "
+                                            "powerups_used played_at day")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    variant TEXT NOT NULL,
+    seed INTEGER,
+    score INTEGER NOT NULL,
+    duration_ms INTEGER NOT NULL,
+    blocks_avoided INTEGER NOT NULL,
+    powerups_used INTEGER NOT NULL,
+    played_at REAL NOT NULL,
+    day TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_by_score ON sessions (variant, score DESC);
+CREATE INDEX IF NOT EXISTS sessions_by_day ON sessions (variant, day, score DESC);
+CREATE TABLE IF NOT EXISTS days (
+    variant TEXT NOT NULL,
+    day TEXT NOT NULL,
+    best INTEGER NOT NULL,
+    sessions INTEGER NOT NULL,
+    PRIMARY KEY (variant, day)
+);
+"""
+COLUMNS = ", ".join(SessionRecord._fields)
+INSERT = f"INSERT INTO sessions ({COLUMNS}) VALUES ({', '.join('?' * len(SessionRecord._fields))})"
+# Rezumatul pe zile se ține la zi la fiecare lot, ca să nu se agrege tot tabelul la citire
+UPSERT_DAY = """
+INSERT INTO days (variant, day, best, sessions) VALUES (?, ?, ?, 1)
+ON CONFLICT (variant, day) DO UPDATE SET best = MAX(best, excluded.best), sessions = sessions + 1
+"""
+
+def scores_requested(argv=None):
+    """Calea bazei de scoruri: `--scores FIȘIER`, implicit SCORES_PATH; None cu `--no-scores`"""
+    argv = sys.argv if argv is None else argv
+    if "--no-scores" in argv:
+        return None
+    if "--scores" in argv:
+        index = argv.index("--scores")
+        if index + 1 < len(argv):
+            return argv[index + 1]
+    return SCORES_PATH
+
+def open_scores(argv=None):
+    """Pentru scripturile cu buclă la nivel de modul: ScoreStore-ul cerut în linia de comandă, sau None"""
+    path = scores_requested(argv)
+    return ScoreStore(path) if path is not None else None
+
+def session_record(variant, score, duration_ms, blocks_avoided=0, powerups_used=0, seed=None, now=None):
+    """SessionRecord pentru o sesiune încheiată acum (sau la `now`, secunde epoch)"""
+    now = time.time() if now is None else now
+    return SessionRecord(variant, seed, int(score), int(duration_ms), int(blocks_avoided),
+                         int(powerups_used), now, time.strftime("%Y-%m-%d", time.localtime(now)))
+
+def connect(path, check_same_thread=True):
+    connection = sqlite3.connect(path, timeout=5.0, check_same_thread=check_same_thread)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")  # În WAL, sigur la căderea procesului
+    return connection
+
+class ScoreStore:
+    """Sesiunile jocurilor, într-o bază SQLite în modul WAL.
+
+    `record()` doar pune sesiunea în coada `pending`; un fir de fundal scrie
+    coada la fiecare FLUSH_INTERVAL, tot lotul într-o singură tranzacție, deci
+    bucla cadrului nu face niciodată I/O. Citirile folosesc o conexiune
+    proprie pentru fiecare fir (în WAL nu așteaptă scrierea) și parcurg doar
+    indexurile (variant, score) și (variant, day, score), deci un clasament
+    costă câteva pagini citite oricâte rânduri ar avea tabelul. Sesiunile încă
+    nescrise se adaugă în rezultatele clasamentelor.
+    """
+    def __init__(self, path=SCORES_PATH, flush_interval=FLUSH_INTERVAL):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.pending = []
+        self.lock = threading.Lock()  # Protejează `pending`
+        self.written = 0
+        self.readers = threading.local()
+        # Conexiunea de scriere e creată aici, dar apoi folosită doar de firul de fundal
+        self.connection = connect(path, check_same_thread=False)
+        self.connection.executescript(SCHEMA)
+        self.stopping = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="scores", daemon=True)
+        self.thread.start()
+
+    def record(self, session):
+        with self.lock:
+            self.pending.append(session)
+
+    def _run(self):
+        while not self.stopping.wait(self.flush_interval):
+            self.flush()
+        self.flush()
+
+    def flush(self):
+        with self.lock:
+            batch = list(self.pending)
+        if not batch:
+            return
+        self.write_batch(batch)
+        with self.lock:
+            del self.pending[:len(batch)]
+
+    def write_batch(self, sessions):
+        """Scrie sesiunile într-o singură tranzacție (folosit de firul de fundal și la importuri)"""
+        with self.connection:
+            self.connection.executemany(INSERT, sessions)
+            self.connection.executemany(UPSERT_DAY, [(session.variant, session.day, session.score)
+                                                     for session in sessions])
+        self.written += len(sessions)
+
+    def close(self):
+        if self.stopping.is_set():
+            return
+        self.stopping.set()
+        self.thread.join()
+        self.connection.close()
+        reader = getattr(self.readers, "connection", None)  # Doar cea a firului care închide
+        if reader is not None:
+            reader.close()
+
+    def _reader(self):
+        connection = getattr(self.readers, "connection", None)
+        if connection is None:
+            connection = self.readers.connection = connect(self.path)
+        return connection
+
+    def _leaderboard(self, query, parameters, limit, keep):
+        # Coada se citește înaintea bazei: o sesiune scoasă din `pending` a fost deja scrisă,
+        # deci SELECT-ul o vede. Una scrisă, dar încă în coadă, apare în ambele și se ia o dată.
+        with self.lock:
+            pending = [session for session in self.pending if keep(session)]
+        rows = [SessionRecord(*row) for row in self._reader().execute(query, parameters).fetchall()]
+        if pending:
+            pending = [session for session in pending if session not in rows]
+            rows = sorted(rows + pending, key=lambda session: -session.score)[:limit]
+        return rows
+
+    def top(self, variant, limit=LEADERBOARD_SIZE):
+        """Cele mai bune `limit` sesiuni ale variantei, de la scorul cel mai mare"""
+        return self._leaderboard(
+            f"SELECT {COLUMNS} FROM sessions WHERE variant = ? ORDER BY score DESC LIMIT ?",
+            (variant, limit), limit, lambda session: session.variant == variant)
+
+    def top_on_day(self, variant, day=None, limit=LEADERBOARD_SIZE):
+        """Cele mai bune sesiuni dintr-o zi (implicit azi)"""
+        day = time.strftime("%Y-%m-%d") if day is None else day
+        return self._leaderboard(
+            f"SELECT {COLUMNS} FROM sessions WHERE variant = ? AND day = ? ORDER BY score DESC LIMIT ?",
+            (variant, day, limit), limit, lambda session: session.variant == variant and session.day == day)
+
+    def daily_best(self, variant, days=7):
+        """(zi, cel mai bun scor, sesiuni) pentru ultimele `days` zile cu sesiuni, cea mai recentă prima.
+
+        Vine din tabelul `days`, deci sesiunile nescrise încă nu sunt incluse.
+        """
+        return self._reader().execute(
+            "SELECT day, best, sessions FROM days WHERE variant = ? ORDER BY day DESC LIMIT ?",
+            (variant, days)).fetchall()
+
+def main():
+    # python scores.py [FIȘIER] [VARIANTĂ]: clasamentele salvate
+    path = sys.argv[1] if len(sys.argv) > 1 else SCORES_PATH
+    variant = sys.argv[2] if len(sys.argv) > 2 else "claude"
+    store = ScoreStore(path)
+    print(f"== {variant}: top {LEADERBOARD_SIZE}")
+    for session in store.top(variant):
+        print(f"{session.score:8d}  {session.duration_ms / 1000:7.1f} s  {session.day}")
+    print("== cel mai bun scor pe zi")
+    for day, best, sessions in store.daily_best(variant):
+        print(f"{day}  {best:8d}  ({sessions} sesiuni)")
+    store.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+class ColumnBuckets:
+    """Index spațial pe coloane verticale pentru blocuri care cad.
+
+    Fiecare entitate e înregistrată în coloanele pe care le acoperă pe orizontală.
+    Blocurile se mișcă doar pe verticală, deci rămân în aceleași coloane până
+    la eliminare; pentru deplasări orizontale există `move`. O interogare
+    atinge doar coloanele care se suprapun cu dreptunghiul căutat, așa că
+    costul coliziunilor nu crește cu numărul total de blocuri de pe ecran.
+    Entitățile sunt indexate după id(), deci merg și obiecte nehashable (pygame.Rect).
+    """
+    def __init__(self, width, column_width):
+        self.column_width = column_width
+        self.columns = max(1, -(-width // column_width))
+        # Dicționare în loc de seturi: ordinea de inserare rămâne deterministă
+        self.buckets = [{} for _ in range(self.columns)]
+        self.spans = {}  # Coloanele în care e înregistrată fiecare entitate
+
+    def _span(self, x, width):
+        first = max(0, int(x) // self.column_width)
+        last = min(self.columns - 1, (int(x) + max(1, int(width)) - 1) // self.column_width)
+        return range(first, last + 1)
+
+    def insert(self, item, x, width):
+        span = self._span(x, width)
+        self.spans[id(item)] = span
+        for column in span:
+            self.buckets[column][id(item)] = item
+
+    def remove(self, item):
+        for column in self.spans.pop(id(item), ()):
+            self.buckets[column].pop(id(item), None)
+
+    def move(self, item, x, width):
+        """Actualizează coloanele unei entități după o deplasare orizontală"""
+        if self.spans.get(id(item)) != self._span(x, width):
+            self.remove(item)
+            self.insert(item, x, width)
+
+    def query(self, x, width):
+        """Entitățile din coloanele acoperite de intervalul [x, x + width)"""
+        span = self._span(x, width)
+        if len(span) == 1:
+            return list(self.buckets[span[0]].values())
+        found = {}
+        for column in span:
+            found.update(self.buckets[column])
+        return list(found.values())
+
+    def clear(self):
+        for bucket in self.buckets:
+            bucket.clear()
+        self.spans.clear()
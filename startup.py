@@ -0,0 +1,137 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import pygame
+
+FONT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "font_cache.json")
+STARTUP_PROBE = "--startup-probe"  # Primul cadru afișat încheie procesul (vezi measure_startup)
+FIRST_FRAME_MARKER = "first-frame"
+STARTUP_RUNS = 5
+ENTRY_POINTS = ("claude.py", "gemini.py", "chatgpt.py", "perplexity.py", "copilot.py")
+
+def fast_start_requested(argv=None):
+    """`--fast-start`: doar subsistemele display și font, restul inițializărilor amânate"""
+    argv = sys.argv if argv is None else argv
+    return "--fast-start" in argv
+
+def refresh_fonts_requested(argv=None):
+    """`--refresh-fonts`: fonturile se rezolvă din nou, de ex. după instalarea unui font lipsă"""
+    argv = sys.argv if argv is None else argv
+    return "--refresh-fonts" in argv
+
+def init_pygame(fast=None):
+    """pygame.init(), sau cu `fast` (implicit din linia de comandă) doar display, font și timer.
+
+    pygame.init() pornește și audio, joystick-urile și restul modulelor, pe
+    care jocurile nu le folosesc.
+    """
+    fast = fast_start_requested() if fast is None else fast
+    if not fast:
+        pygame.init()
+        return
+    pygame.display.init()
+    pygame.font.init()
+    pygame.time.wait(0)  # Pornește timer-ul SDL; fără el pygame.time.get_ticks() întoarce 0
+
+class FontPathCache:
+    """Fișierele rezolvate de pygame.font.SysFont, păstrate pe disc între porniri.
+
+    SysFont citește la primul apel toate fonturile sistemului (fc-list pe
+    Linux, registrul pe Windows). Aici fiecare (nume, bold, italic) se
+    rezolvă o singură dată, prin SysFont, iar fișierul ales și stilurile
+    simulate se salvează în `path`; la pornirile următoare fontul se
+    deschide direct din fișier. O intrare al cărei fișier a dispărut se
+    rezolvă din nou. Un nume negăsit rămâne pe fontul implicit (cale None)
+    până la o pornire cu `refresh` (--refresh-fonts), care ignoră tot
+    cache-ul și îl rescrie.
+    """
+    def __init__(self, path=FONT_CACHE_PATH, refresh=None):
+        self.path = path
+        self.refresh = refresh_fonts_requested() if refresh is None else refresh
+        self.entries = None  # Citite la prima cerere
+
+    def _load(self):
+        if self.refresh:
+            self.entries = {}
+            return
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                self.entries = json.load(file)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def _save(self):
+        # Scris prin redenumire, ca două procese pornite deodată să nu lase un fișier trunchiat
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary, "w", encoding="utf-8") as file:
+                json.dump(self.entries, file, indent=2, sort_keys=True)
+            os.replace(temporary, self.path)
+        except OSError:
+            pass  # Fără cache pe disc (de ex. director read-only) fontul se rezolvă la fiecare pornire
+
+    def font(self, name, size, bold=False, italic=False):
+        if self.entries is None:
+            self._load()
+        key = f"{name or ''}|{int(bool(bold))}|{int(bool(italic))}"
+        entry = self.entries.get(key)
+        if entry is not None and (entry[0] is None or os.path.exists(entry[0])):
+            path, set_bold, set_italic = entry
+            return pygame.sysfont.font_constructor(path, size, set_bold, set_italic)
+
+        def remember(path, size, set_bold, set_italic):
+            self.entries[key] = [path, set_bold, set_italic]
+            return pygame.sysfont.font_constructor(path, size, set_bold, set_italic)
+        font = pygame.font.SysFont(name, size, bold, italic, constructor=remember)
+        self._save()
+        return font
+
+# Cache-ul comun al variantelor jocului
+font_paths = FontPathCache()
+
+def sys_font(name, size, bold=False, italic=False):
+    """Ca pygame.font.SysFont(...), dar cu fișierul fontului luat din cache-ul de pe disc"""
+    return font_paths.font(name, size, bold, italic)
+
+_probe_pending = STARTUP_PROBE in sys.argv
+
+def frame_presented():
+    """Apelat după fiecare cadru afișat; cu --startup-probe, primul cadru încheie procesul"""
+    if _probe_pending:
+        print(FIRST_FRAME_MARKER, flush=True)
+        os._exit(0)
+
+def measure_startup(script, extra_args=(), timeout=30.0):
+    """Secundele de la lansarea `script` (proces nou) până la primul cadru afișat"""
+    environment = dict(os.environ, SDL_VIDEODRIVER=os.environ.get("SDL_VIDEODRIVER", "dummy"),
+                       PYGAME_HIDE_SUPPORT_PROMPT="1")
+    command = [sys.executable, script, STARTUP_PROBE, "--no-scores", *extra_args]
+    start = time.perf_counter()
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+                               env=environment, cwd=os.path.dirname(os.path.abspath(__file__)))
+    try:
+        for line in process.stdout:
+            if line.strip() == FIRST_FRAME_MARKER:
+                return time.perf_counter() - start
+        raise RuntimeError(f"{script} s-a oprit fără să afișeze un cadru")
+    finally:
+        process.kill()
+        process.wait(timeout)
+
+def main():
+    # python startup.py [RULĂRI]: timpul până la primul cadru, implicit și cu --fast-start
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else STARTUP_RUNS
+    print(f"{'script':<16} {'implicit ms':>12} {'--fast-start ms':>16}")
+    for script in ENTRY_POINTS:
+        medians = []
+        for extra_args in ((), ("--fast-start",)):
+            measure_startup(script, extra_args)  # Prima pornire umple cache-urile (fonturi, .pyc)
+            medians.append(statistics.median(measure_startup(script, extra_args) for _ in range(runs)) * 1000)
+        print(f"{script:<16} {medians[0]:>12.1f} {medians[1]:>16.1f}")
+
+if __name__ == "__main__":
+    main()
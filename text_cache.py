@@ -0,0 +1,48 @@
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 256
+
+class TextCache:
+    """Cache LRU pentru suprafețele produse de font.render.
+
+    Cheia este (font, text, antialias, culoare, fundal); un text deja randat se
+    returnează direct, fără alt apel font.render. Cele mai vechi intrări sunt
+    eliminate peste `max_entries`. Suprafețele returnate sunt partajate, deci
+    nu trebuie modificate de apelant.
+    """
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        key = (font, text, antialias, tuple(color), None if background is None else tuple(background))
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color, background)
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+# Cache-ul comun folosit de toate variantele jocului
+text_cache = TextCache()
+
+def render_text(font, text, antialias, color, background=None):
+    """Ca font.render(...), dar prin cache-ul comun"""
+    return text_cache.render(font, text, antialias, color, background)
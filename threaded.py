@@ -0,0 +1,161 @@
+import sys
+import threading
+import time
+from collections import namedtuple
+
+HISTOGRAM_BIN_MS = 1.0
+HISTOGRAM_MAX_MS = 100.0  # Duratele mai lungi intră în ultimul bin
+
+# Un cadru publicat de firul simulării: starea jocului, Simulation.snapshot() și momentul
+# publicării (time.perf_counter), împreună cu fracțiunea de tick deja acumulată atunci
+PublishedFrame = namedtuple("PublishedFrame", "state snapshot published_at alpha")
+
+def threaded_requested(argv=None):
+    """`--threaded`: simularea rulează pe un fir separat de desenare"""
+    argv = sys.argv if argv is None else argv
+    return "--threaded" in argv
+
+def frame_histogram_requested(argv=None):
+    """`--frame-histogram`: histogramele duratelor se afișează la ieșire"""
+    argv = sys.argv if argv is None else argv
+    return "--frame-histogram" in argv
+
+class FrameTimeHistogram:
+    """Histogramă a unor durate (ms), pe bin-uri fixe de `bin_ms`"""
+    def __init__(self, name, bin_ms=HISTOGRAM_BIN_MS, max_ms=HISTOGRAM_MAX_MS):
+        self.name = name
+        self.bin_ms = bin_ms
+        self.counts = [0] * (int(max_ms / bin_ms) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.last = None
+
+    def add(self, ms):
+        self.counts[min(len(self.counts) - 1, int(ms / self.bin_ms))] += 1
+        self.total += 1
+        self.sum_ms += ms
+
+    def mark(self, now):
+        """Adaugă intervalul de la apelul anterior până la `now` (secunde, perf_counter)"""
+        if self.last is not None:
+            self.add((now - self.last) * 1000)
+        self.last = now
+
+    def percentile(self, q):
+        """Limita superioară a bin-ului în care cade percentila `q` (0-100)"""
+        if not self.total:
+            return 0.0
+        target = self.total * q / 100
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return (index + 1) * self.bin_ms
+        return len(self.counts) * self.bin_ms
+
+    def report(self, width=40):
+        """Histograma ca text: rezumatul, apoi un rând cu bară pentru fiecare bin ocupat"""
+        if not self.total:
+            return f"{self.name}: fără eșantioane"
+        lines = [f"{self.name}: {self.total} eșantioane, medie {self.sum_ms / self.total:.2f} ms, "
+                 f"p50 {self.percentile(50):.0f}  p95 {self.percentile(95):.0f}  p99 {self.percentile(99):.0f} ms"]
+        peak = max(self.counts)
+        for index, count in enumerate(self.counts):
+            if count:
+                bar = "#" * max(1, round(count / peak * width))
+                lines.append(f"  {index * self.bin_ms:5.0f}-{(index + 1) * self.bin_ms:<4.0f} {count:7d} {bar}")
+        return "\n".join(lines)
+
+class DoubleBuffer:
+    """Două sloturi între un scriitor și un cititor.
+
+    Scriitorul completează slotul din spate și apoi îl publică printr-o
+    singură atribuire (atomică sub GIL); cititorul ia mereu ultimul slot
+    publicat, fără lock și fără să vadă vreodată un cadru pe jumătate scris.
+    Valorile publicate nu se mai modifică după publicare.
+    """
+    def __init__(self):
+        self.slots = [None, None]
+        self.front = 0
+        self.published = 0
+
+    def publish(self, item):
+        back = self.front ^ 1
+        self.slots[back] = item
+        self.front = back
+        self.published += 1
+
+    def latest(self):
+        return self.slots[self.front]
+
+class SimulationThread(threading.Thread):
+    """Rulează `game.advance` în timp real, pe un fir separat, și publică fiecare pas în `game.frames`.
+
+    Simularea se face sub `game.sim_lock`, pe care firul principal îl ia doar
+    cât procesează evenimentele. Între pași firul doarme până la tick-ul
+    următor, deci GIL-ul rămâne liber pentru desenare.
+    """
+    def __init__(self, game):
+        super().__init__(name="simulation", daemon=True)
+        self.game = game
+        self.stopping = threading.Event()
+
+    def run(self):
+        game = self.game
+        clock = time.perf_counter
+        last = clock()
+        while not self.stopping.is_set():
+            now = clock()
+            with game.sim_lock:
+                game.advance((now - last) * 1000, game.input_keys)
+                game.publish_frame()
+                wait = (game.tick_ms() - game.accumulator) / 1000
+            last = now
+            if wait > 0:
+                self.stopping.wait(wait)
+
+    def stop(self):
+        self.stopping.set()
+        self.join()
+
+def compare_modes(seconds=5.0, extra_blits=0):
+    """Rulează claude.Game câte `seconds` secunde în fiecare mod și întoarce histogramele.
+
+    `extra_blits` adaugă la fiecare cadru atâtea blit-uri pe tot ecranul,
+    ca să simuleze o desenare lentă; blit-urile eliberează GIL-ul, deci în
+    modul cu fire pașii simulării ar trebui să rămână la intervale egale.
+    """
+    import os
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from claude import Game
+
+    results = {}
+    for threaded in (False, True):
+        game = Game(threaded=threaded)
+        if extra_blits:
+            draw_game = game.draw_game
+            load = pygame.Surface(game.screen.get_size())
+
+            def loaded_draw_game(draw_game=draw_game, game=game, load=load):
+                draw_game()
+                for _ in range(extra_blits):
+                    game.screen.blit(load, (0, 0), special_flags=pygame.BLEND_ADD)
+            game.draw_game = loaded_draw_game
+        game.start_session()
+        game.player.activate_shield(seconds * 2000)  # Sesiunea nu se termină în timpul măsurătorii
+        game.run_loop(seconds)
+        results["cu fire" if threaded else "un fir"] = (game.frame_histogram, game.sim_histogram)
+    return results
+
+def main():
+    # python threaded.py [SECUNDE] [BLIT-URI SUPLIMENTARE PE CADRU]
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    extra_blits = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    for mode, histograms in compare_modes(seconds, extra_blits).items():
+        print(f"== {mode}")
+        for histogram in histograms:
+            print(histogram.report())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+TRACE_CAPACITY = 200_000  # Evenimente păstrate; cele mai vechi se pierd primele
+
+def trace_requested(argv=None):
+    """Calea din `--trace FIȘIER`, sau None"""
+    argv = sys.argv if argv is None else argv
+    if "--trace" in argv:
+        index = argv.index("--trace")
+        if index + 1 < len(argv):
+            return argv[index + 1]
+    return None
+
+class Tracer:
+    """Intervale imbricate pe cadru, exportate ca trace-event JSON (Chrome/Perfetto).
+
+    Se folosește ca `with tracer.span("draw"):`. Când e dezactivat, `span`
+    doar întoarce tracer-ul, deci instrumentarea din bucla jocului rămâne
+    practic gratuită. Evenimentele se țin într-un buffer limitat la
+    `capacity`; la depășire se pierd cele mai vechi și se numără în `dropped`.
+    `flush()` scrie fișierul (de obicei la ieșire), deschis apoi în
+    chrome://tracing sau ui.perfetto.dev.
+    """
+    def __init__(self, capacity=TRACE_CAPACITY):
+        self.capacity = capacity
+        self.enabled = False
+        self.path = None
+        self.events = deque(maxlen=capacity)
+        self.recorded = 0
+        self.local = threading.local()  # Stiva de intervale deschise, separată pe fiecare fir
+        self.origin = time.perf_counter_ns()
+
+    @property
+    def dropped(self):
+        return max(0, self.recorded - len(self.events))
+
+    def enable(self, path):
+        self.path = path
+        self.enabled = True
+
+    @property
+    def stack(self):
+        stack = getattr(self.local, "stack", None)
+        if stack is None:
+            stack = self.local.stack = []
+        return stack
+
+    def span(self, name):
+        if self.enabled:
+            self.stack.append((name, time.perf_counter_ns()))
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if self.enabled:
+            name, start = self.stack.pop()
+            self.events.append((name, start, time.perf_counter_ns() - start, threading.get_ident()))
+            self.recorded += 1
+
+    def trace_events(self):
+        """Evenimentele în formatul „complete event” (ph = X), cu timpi în microsecunde"""
+        pid = os.getpid()
+        return [{"name": name, "ph": "X", "ts": (start - self.origin) / 1000, "dur": duration / 1000,
+                 "pid": pid, "tid": tid}
+                for name, start, duration, tid in self.events]
+
+    def flush(self, path=None):
+        path = path or self.path
+        if path is None:
+            return
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms",
+                       "otherData": {"dropped_events": self.dropped}}, file)
+        self.events.clear()
+        self.recorded = 0
+
+# Tracer-ul comun; se activează din Game cu --trace FIȘIER
+tracer = Tracer()
@@ -0,0 +1,323 @@
+import sys
+import time
+
+import numpy as np
+
+from dodge.claude import (SCREEN_WIDTH, SCREEN_HEIGHT, PLAYER_SIZE, PLAYER_SPEED, BLOCK_SIZE,
+                          INITIAL_BLOCK_SPEED, GRID_COLUMNS, COLUMN_WIDTH, MAX_SIMULTANEOUS_BLOCKS,
+                          POWERUP_SHIELD, POWERUP_SLOW, POWERUP_DOUBLE, SHIELD_DURATION, SLOW_TIME_DURATION,
+                          DOUBLE_POINTS_DURATION, INVINCIBILITY_DURATION, POSITION_SAMPLE_INTERVAL)
+
+FPS = 60
+POWERUP_SIZE = 24
+HITBOX_SIZE = int(PLAYER_SIZE * 0.9)  # Ca Player.size
+HITBOX_OFFSET = (PLAYER_SIZE - HITBOX_SIZE) // 2
+HISTORY_LENGTH = 10  # Ultimele poziții păstrate de Player.position_history
+SEGMENTS = 8  # Segmentele din Player.get_position_weights
+COLUMNS_PER_SEGMENT = GRID_COLUMNS // SEGMENTS
+
+# Observația: 8 valori pentru jucător + 4 pentru fiecare slot de entitate
+PLAYER_FEATURES = 8
+SLOT_FEATURES = 4
+OBSERVATION_SIZE = PLAYER_FEATURES + SLOT_FEATURES * MAX_SIMULTANEOUS_BLOCKS
+
+class VectorEnv:
+    """N jocuri claude.py independente, pe tablouri NumPy, avansate în lockstep.
+
+    `step(actions)` primește un tablou (N, 4) cu tastele W, A, S, D și aplică
+    regulile din Simulation.step și ProbabilisticGenerator.get_spawn_positions
+    pentru toate jocurile deodată. Jocurile terminate se resetează automat.
+    Particulele și flash-ul ecranului sunt doar vizuale și nu sunt simulate.
+    """
+    def __init__(self, num_envs, seed=None, fps=FPS, max_frames=None):
+        self.num_envs = num_envs
+        self.fps = fps
+        self.max_frames = max_frames  # Trunchiere opțională a episoadelor
+        self.rng = np.random.default_rng(seed)
+
+        n, k = num_envs, MAX_SIMULTANEOUS_BLOCKS
+        self.env_index = np.arange(n)
+        self.column_index = np.arange(GRID_COLUMNS)
+
+        # Jucător
+        self.player_x = np.zeros(n, dtype=np.int64)
+        self.player_y = np.zeros(n, dtype=np.int64)
+        self.hp = np.zeros(n, dtype=np.int64)
+        self.shield_timer = np.zeros(n, dtype=np.int64)
+        self.invincible_timer = np.zeros(n, dtype=np.int64)
+        self.position_history = np.zeros((n, HISTORY_LENGTH), dtype=np.int64)
+        self.history_length = np.zeros(n, dtype=np.int64)
+        self.position_timer = np.zeros(n, dtype=np.int64)
+
+        # Blocuri și power-ups în sloturi fixe; `order` păstrează ordinea de spawn
+        self.alive = np.zeros((n, k), dtype=bool)
+        self.x = np.zeros((n, k), dtype=np.int64)
+        self.y = np.zeros((n, k), dtype=np.float64)
+        self.size = np.zeros((n, k), dtype=np.int64)
+        self.is_powerup = np.zeros((n, k), dtype=bool)
+        self.powerup_type = np.zeros((n, k), dtype=np.int64)
+        self.order = np.zeros((n, k), dtype=np.int64)
+        self.next_order = np.zeros(n, dtype=np.int64)
+
+        # Timere și scor
+        self.frame = np.zeros(n, dtype=np.int64)
+        self.elapsed_time = np.zeros(n, dtype=np.int64)
+        self.current_speed = np.zeros(n, dtype=np.int64)
+        self.speed_increase_timer = np.zeros(n, dtype=np.int64)
+        self.slow_time_timer = np.zeros(n, dtype=np.int64)
+        self.double_points_timer = np.zeros(n, dtype=np.int64)
+        self.spawn_timer = np.zeros(n, dtype=np.int64)
+        self.next_spawn_time = np.zeros(n, dtype=np.int64)
+        self.blocks_avoided = np.zeros(n, dtype=np.int64)
+        self.score = np.zeros(n, dtype=np.int64)
+
+        self.reset()
+
+    def reset(self):
+        self._reset_envs(np.ones(self.num_envs, dtype=bool))
+        return self.observe()
+
+    def _reset_envs(self, mask):
+        count = int(np.count_nonzero(mask))
+        if not count:
+            return
+        self.player_x[mask] = SCREEN_WIDTH // 2
+        self.player_y[mask] = SCREEN_HEIGHT - 50
+        self.hp[mask] = 3
+        self.shield_timer[mask] = 0
+        self.invincible_timer[mask] = 0
+        self.history_length[mask] = 0
+        self.position_timer[mask] = 0
+
+        self.alive[mask] = False
+        self.next_order[mask] = 0
+
+        self.frame[mask] = 0
+        self.elapsed_time[mask] = 0
+        self.current_speed[mask] = INITIAL_BLOCK_SPEED
+        self.speed_increase_timer[mask] = 0
+        self.slow_time_timer[mask] = 0
+        self.double_points_timer[mask] = 0
+        self.spawn_timer[mask] = 0
+        self.next_spawn_time[mask] = self.rng.integers(500, 1501, count)
+        self.blocks_avoided[mask] = 0
+        self.score[mask] = 0
+
+    def observe(self):
+        """Observațiile (N, OBSERVATION_SIZE) ca float32"""
+        obs = np.empty((self.num_envs, OBSERVATION_SIZE), dtype=np.float32)
+        obs[:, 0] = self.player_x
+        obs[:, 1] = self.player_y
+        obs[:, 2] = self.hp
+        obs[:, 3] = self.shield_timer
+        obs[:, 4] = self.invincible_timer
+        obs[:, 5] = self.slow_time_timer
+        obs[:, 6] = self.double_points_timer
+        obs[:, 7] = self.current_speed
+
+        slots = obs[:, PLAYER_FEATURES:].reshape(self.num_envs, MAX_SIMULTANEOUS_BLOCKS, SLOT_FEATURES)
+        slots[:, :, 0] = self.alive
+        slots[:, :, 1] = self.x
+        slots[:, :, 2] = self.y
+        # 0 pentru bloc, 1 + tipul pentru power-up
+        slots[:, :, 3] = np.where(self.is_powerup, self.powerup_type + 1, 0)
+        slots[~self.alive] = 0
+        return obs
+
+    def _choose(self, mask):
+        """Alege uniform câte o coloană True pe fiecare rând din `mask`"""
+        keys = self.rng.random(mask.shape)
+        keys[~mask] = -1.0
+        return np.argmax(keys, axis=1)
+
+    def _first_in_order(self, mask):
+        """Slotul cel mai vechi (după ordinea de spawn) marcat în `mask`"""
+        return np.argmin(np.where(mask, self.order, np.iinfo(np.int64).max), axis=1)
+
+    def step(self, actions):
+        """Avansează toate jocurile cu un cadru.
+
+        Returnează (observații, recompense, done, info); recompensa este
+        creșterea scorului, iar info["final_score"] are scorul final pentru
+        jocurile terminate (și -1 pentru restul).
+        """
+        actions = np.asarray(actions, dtype=bool).reshape(self.num_envs, 4)
+        key_w, key_a, key_s, key_d = actions.T
+        previous_score = self.score.copy()
+
+        # Ceas virtual cu pas fix, ca headless.VirtualClock
+        self.frame += 1
+        dt = self.frame * 1000 // self.fps - (self.frame - 1) * 1000 // self.fps
+        self.elapsed_time += dt
+
+        # Controlul WASD (fiecare test vede poziția deja actualizată, ca în Player.update)
+        self.player_y -= PLAYER_SPEED * (key_w & (self.player_y > 0))
+        self.player_y += PLAYER_SPEED * (key_s & (self.player_y < SCREEN_HEIGHT - PLAYER_SIZE))
+        self.player_x -= PLAYER_SPEED * (key_a & (self.player_x > 0))
+        self.player_x += PLAYER_SPEED * (key_d & (self.player_x < SCREEN_WIDTH - PLAYER_SIZE))
+
+        # Istoricul pozițiilor la fiecare POSITION_SAMPLE_INTERVAL ms
+        self.position_timer += dt
+        record = self.position_timer >= POSITION_SAMPLE_INTERVAL
+        if record.any():
+            self.position_history[record, :-1] = self.position_history[record, 1:]
+            self.position_history[record, -1] = self.player_x[record] + PLAYER_SIZE // 2
+            self.history_length[record] = np.minimum(self.history_length[record] + 1, HISTORY_LENGTH)
+            self.position_timer[record] = 0
+
+        # Timerele (ms) sunt active cât timp sunt pozitive
+        for timer in (self.shield_timer, self.invincible_timer,
+                      self.slow_time_timer, self.double_points_timer):
+            timer -= np.minimum(timer, dt)
+
+        self.speed_increase_timer += dt
+        speed_up = self.speed_increase_timer >= 30000
+        self.current_speed += speed_up
+        self.speed_increase_timer[speed_up] = 0
+
+        self.spawn_timer += dt
+        spawning = self.spawn_timer >= self.next_spawn_time
+        if spawning.any():
+            self.spawn_timer[spawning] = 0
+            self.next_spawn_time[spawning] = self.rng.integers(500, 1501, int(np.count_nonzero(spawning)))
+            self._spawn(np.flatnonzero(spawning))
+
+        # Mișcare; slow time înjumătățește viteza tuturor entităților
+        speed = np.where(self.slow_time_timer > 0, self.current_speed * 0.5, self.current_speed)
+        self.y += speed[:, None]
+
+        off_screen = self.alive & (self.y > SCREEN_HEIGHT)
+        avoided = np.count_nonzero(off_screen & ~self.is_powerup, axis=1)
+        points = np.where(self.double_points_timer > 0, 2, 1)
+        self.blocks_avoided += avoided * points
+        self.alive &= ~off_screen
+
+        self._collide()
+
+        # Scorul: secunde (dublate cu Puncte x2) + blocuri evitate
+        seconds = self.elapsed_time // 1000
+        self.score = np.where(self.double_points_timer > 0, seconds * 2, seconds) + self.blocks_avoided
+        rewards = (self.score - previous_score).astype(np.float32)
+
+        dones = self.hp <= 0
+        if self.max_frames is not None:
+            dones |= self.frame >= self.max_frames
+        final_score = np.where(dones, self.score, -1)
+        self._reset_envs(dones)
+        return self.observe(), rewards, dones, {"final_score": final_score}
+
+    def _spawn(self, envs):
+        """Regulile din ProbabilisticGenerator.get_spawn_positions, pentru jocurile `envs`"""
+        count = len(envs)
+        alive = self.alive[envs]
+        occupied = np.zeros((count, GRID_COLUMNS), dtype=bool)
+        near_top = alive & (self.y[envs] < SCREEN_HEIGHT // 3)
+        rows, slots = np.nonzero(near_top)
+        occupied[rows, self.x[envs][rows, slots] // COLUMN_WIDTH] = True
+        free = ~occupied
+
+        max_new_blocks = MAX_SIMULTANEOUS_BLOCKS - np.count_nonzero(alive, axis=1)
+        num_blocks = np.minimum(self.rng.integers(1, 4, count),
+                                np.minimum(np.count_nonzero(free, axis=1), max_new_blocks))
+
+        # Ponderile pe segmente din istoricul pozițiilor (doar cu minim 3 poziții)
+        has_weights = self.history_length[envs] >= 3
+        recent = np.arange(HISTORY_LENGTH) >= HISTORY_LENGTH - self.history_length[envs][:, None]
+        segments = np.clip(self.position_history[envs] // (SCREEN_WIDTH // SEGMENTS), 0, SEGMENTS - 1)
+        segment_counts = np.zeros((count, SEGMENTS), dtype=np.int64)
+        np.add.at(segment_counts, (np.repeat(np.arange(count), HISTORY_LENGTH), segments.ravel()),
+                  recent.ravel())
+        cumulative = np.cumsum(segment_counts, axis=1)
+
+        player_is_left = self.player_x[envs] + PLAYER_SIZE // 2 < SCREEN_WIDTH // 2
+        right_half = self.column_index >= GRID_COLUMNS // 2
+        safe_side = np.where(player_is_left[:, None], right_half, ~right_half)
+
+        for i in range(3):
+            active = i < num_blocks
+            if not active.any():
+                break
+            is_powerup = self.rng.random(count) < 0.05
+
+            # Power-ups în zona sigură (opusă jucătorului), dacă există
+            safe = free & safe_side
+            powerup_column = self._choose(np.where(safe.any(axis=1)[:, None], safe, free))
+
+            # Blocuri: 30% regresie pe segmentele frecventate, altfel aleator
+            use_weights = has_weights & (self.rng.random(count) < 0.3)
+            pick = self.rng.random(count) * np.maximum(cumulative[:, -1], 1)
+            segment = np.argmax(cumulative > pick[:, None], axis=1)
+            segment_start = segment * COLUMNS_PER_SEGMENT
+            in_segment = free & (self.column_index >= segment_start[:, None]) \
+                & (self.column_index < (segment_start + COLUMNS_PER_SEGMENT)[:, None])
+            weighted_column = self._choose(np.where(in_segment.any(axis=1)[:, None], in_segment, free))
+            random_column = self._choose(free)
+
+            column = np.where(is_powerup, powerup_column,
+                              np.where(use_weights, weighted_column, random_column))
+            x = column * COLUMN_WIDTH + self.rng.integers(0, COLUMN_WIDTH - BLOCK_SIZE + 1, count)
+            x = np.clip(x, 0, SCREEN_WIDTH - BLOCK_SIZE)
+            powerup_type = self.rng.integers(0, 3, count)
+
+            rows = np.flatnonzero(active)
+            target = envs[rows]
+            slot = np.argmin(self.alive[target], axis=1)
+            self.alive[target, slot] = True
+            self.x[target, slot] = x[rows]
+            self.y[target, slot] = np.where(is_powerup[rows], -POWERUP_SIZE, -BLOCK_SIZE)
+            self.size[target, slot] = np.where(is_powerup[rows], POWERUP_SIZE, BLOCK_SIZE)
+            self.is_powerup[target, slot] = is_powerup[rows]
+            self.powerup_type[target, slot] = powerup_type[rows]
+            self.order[target, slot] = self.next_order[target]
+            self.next_order[target] += 1
+            free[rows, column[rows]] = False
+
+    def _collide(self):
+        left = self.player_x + HITBOX_OFFSET
+        top = self.player_y + HITBOX_OFFSET
+        # pygame.Rect trunchiază coordonatele reale spre zero
+        y = np.trunc(self.y)
+        hit = self.alive \
+            & (self.x < (left + HITBOX_SIZE)[:, None]) & (left[:, None] < self.x + self.size) \
+            & (y < (top + HITBOX_SIZE)[:, None]) & (top[:, None] < y + self.size)
+
+        # Primul power-up atins se aplică și dispare
+        powerup_hit = hit & self.is_powerup
+        collected = powerup_hit.any(axis=1)
+        if collected.any():
+            envs = np.flatnonzero(collected)
+            slot = self._first_in_order(powerup_hit)[envs]
+            kind = self.powerup_type[envs, slot]
+            self.shield_timer[envs[kind == POWERUP_SHIELD]] = SHIELD_DURATION
+            self.slow_time_timer[envs[kind == POWERUP_SLOW]] = SLOW_TIME_DURATION
+            self.double_points_timer[envs[kind == POWERUP_DOUBLE]] = DOUBLE_POINTS_DURATION
+            self.alive[envs, slot] = False
+
+        # Primul bloc atins face damage dacă jucătorul nu e protejat
+        block_hit = hit & ~self.is_powerup
+        damaged = block_hit.any(axis=1) & (self.invincible_timer <= 0) & (self.shield_timer <= 0)
+        if damaged.any():
+            envs = np.flatnonzero(damaged)
+            slot = self._first_in_order(block_hit)[envs]
+            self.hp[envs] -= 1
+            self.invincible_timer[envs] = INVINCIBILITY_DURATION
+            self.alive[envs, slot] = False
+
+def main():
+    num_envs = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    frames = 600
+    env = VectorEnv(num_envs, seed=0)
+    rng = np.random.default_rng(0)
+
+    start = time.perf_counter()
+    finished = 0
+    for _ in range(frames):
+        actions = rng.random((num_envs, 4)) < 0.25
+        _, _, dones, _ = env.step(actions)
+        finished += int(np.count_nonzero(dones))
+    elapsed = time.perf_counter() - start
+    print(f"{num_envs} jocuri x {frames} cadre în {elapsed:.2f}s "
+          f"({num_envs * frames / elapsed:.0f} cadre/s, {finished} episoade terminate)")
+
+if __name__ == "__main__":
+    main()